@@ -1,13 +1,18 @@
 import asyncio
 import logging
+import math
 import random
+import re
 import time
-import urllib.parse
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import quote
 
 import aiohttp
 import discord
+from discord.ext import tasks
 from redbot.core import Config, commands
 
 log = logging.getLogger("red.greyasuka.unified_audio_radio")
@@ -16,38 +21,76 @@ RB_API = "https://de2.api.radio-browser.info/json"
 USER_AGENT = "Red-DiscordBot/UnifiedAudioRadio (GreyHairAsuka APPROVED++)"
 
 SEARCH_LIMIT = 50
+RB_CACHE_TTL = 300.0
+RB_CACHE_STALE = 1800.0  # past TTL but within this age: serve stale, refresh in background
+RB_CACHE_MAX = 128
 PAGE_SIZE = 10
-REACTION_TIMEOUT = 35.0
-
-WATCHDOG_INTERVAL = 8.0
+MAX_PAGES = 5  # stop filtering once this many pages of results are collected
+STATIONS_LRU_MAX = 32
+PAGER_TIMEOUT = 35.0
+STATUS_CACHE_TTL = 2.0  # repeat rrstatus within this window resends the last embed
+
+# voice moves are handled by on_voice_state_update; the tick is only a backstop for missed events
+WATCHDOG_INTERVAL = 60.0
+VOICE_RECHECK_DELAY = 3.0  # let the voice client settle before judging a bot move
 SUMMON_GRACE_SECONDS = 10.0
 HOME_GRACE_SECONDS = 15.0
 
 REASSURE_TICK = 10.0
+REASSURE_EVERY = math.ceil(REASSURE_TICK / WATCHDOG_INTERVAL)  # in watchdog ticks
+# re-read the whole Config scope this often, to pick up edits made outside the cog
+CFG_REFRESH_SECONDS = 30.0
+# deferred (write-behind) Config values are persisted with the next write, or after this delay
+CFG_FLUSH_DELAY = 5.0
+
+ID_KEYS = (
+    "allowed_guild_id",
+    "control_text_channel_id",
+    "allowed_voice_channel_id",
+    "audit_channel_id",
+    "bound_owner_user_id",
+    "dj_user_id",
+    "reassure_fallback_channel_id",
+)
+
+PANIC_SNAPSHOT_KEYS = (
+    "panic_resume_kind",
+    "panic_resume_station_name",
+    "panic_resume_station_url",
+    "panic_resume_youtube_query",
+)
+
+# blocklists up to this size are scanned with plain `in`; larger ones use one compiled pattern
+SMALL_BLOCKLIST = 3
+
+
+# fields probed on Lavalink / voice-client track objects for blocklist text
+_TRACK_ATTRS = ("title", "author", "uri", "identifier", "track_identifier", "source", "url")
+_TRACK_KEYS = ("title", "author", "uri", "identifier", "source", "url")
+_VC_TRACK_HOLDERS = ("current", "current_track", "track", "now_playing", "playing")
+
+_YT_RE = re.compile(r"youtu\.be|youtube\.com|youtube | yt |ytsearch:|youtubemusic", re.IGNORECASE)
 
 
 def _looks_like_youtube(text: str) -> bool:
-    t = (text or "").lower()
-    return any(
-        x in t
-        for x in (
-            "youtu.be",
-            "youtube.com",
-            "youtube ",
-            " yt ",
-            "ytsearch:",
-            "youtubemusic",
-        )
-    )
+    return bool(text and _YT_RE.search(text))
 
 
 @dataclass(frozen=True)
 class Station:
+    # explicit slots (no per-instance __dict__); dataclass(slots=True) needs 3.10+
+    __slots__ = ("name", "country", "bitrate", "tags", "stream_url", "label", "detail", "blob")
+
     name: str
     country: str
     bitrate: int
     tags: str
     stream_url: str
+    # pre-rendered search-result field text (index is prefixed at render time)
+    label: str
+    detail: str
+    # lowercased "tags name", matched against the blocklist
+    blob: str
 
     @staticmethod
     def from_rb(payload: Dict[str, Any]) -> Optional["Station"]:
@@ -71,7 +114,62 @@ class Station:
         ):
             return None
 
-        return Station(name=name, country=country, bitrate=bitrate, tags=tags, stream_url=stream_url)
+        short_tags = tags or "No tags"
+        if len(short_tags) > 100:
+            short_tags = short_tags[:97] + "..."
+        return Station(
+            name=name,
+            country=country,
+            bitrate=bitrate,
+            tags=tags,
+            stream_url=stream_url,
+            label=f"{name} ({country})",
+            detail=f"Bitrate: {bitrate} kbps\nTags: {short_tags}"[:1024],
+            blob=f"{tags} {name}".lower(),
+        )
+
+
+class _PagerView(discord.ui.View):
+    """Button pager for searchstations; embeds are pre-built, clicks only pick one."""
+
+    def __init__(self, author_id: int, embeds: List[discord.Embed]):
+        super().__init__(timeout=PAGER_TIMEOUT)
+        self.author_id = author_id
+        self.embeds = embeds
+        self.page = 0
+        self.message: Optional[discord.Message] = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    async def _show(self, interaction: discord.Interaction, page: int) -> None:
+        self.page = max(0, min(page, len(self.embeds) - 1))
+        await interaction.response.edit_message(embed=self.embeds[self.page])
+
+    @discord.ui.button(emoji="⏮️", style=discord.ButtonStyle.secondary)
+    async def first(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, 0)
+
+    @discord.ui.button(emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def prev(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page - 1)
+
+    @discord.ui.button(emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.page + 1)
+
+    @discord.ui.button(emoji="⏭️", style=discord.ButtonStyle.secondary)
+    async def last(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, len(self.embeds) - 1)
+
+    async def on_timeout(self) -> None:
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
 
 
 class UnifiedAudioRadio(commands.Cog):
@@ -100,10 +198,10 @@ class UnifiedAudioRadio(commands.Cog):
     - rrmove / rrmigrate = rebinds to a NEW server (guild) using current text channel + your current VC
     """
 
-    AUDIO_SUMMON_ALIASES: Set[str] = {"summon", "join", "connect"}
-    AUDIO_DISCONNECT_ALIASES: Set[str] = {"disconnect", "dc", "leave"}
-    AUDIO_STOP_ALIASES: Set[str] = {"stop"}
-    AUDIO_PLAY_ALIASES: Set[str] = {"play", "local", "playurl", "playlist"}  # varies by Audio version
+    AUDIO_SUMMON_ALIASES: FrozenSet[str] = frozenset({"summon", "join", "connect"})
+    AUDIO_DISCONNECT_ALIASES: FrozenSet[str] = frozenset({"disconnect", "dc", "leave"})
+    AUDIO_STOP_ALIASES: FrozenSet[str] = frozenset({"stop"})
+    AUDIO_PLAY_ALIASES: FrozenSet[str] = frozenset({"play", "local", "playurl", "playlist"})  # varies by Audio version
 
     def __init__(self, bot):
         self.bot = bot
@@ -138,7 +236,6 @@ class UnifiedAudioRadio(commands.Cog):
 
             # audio intent (youtube-ish)
             audio_intent_active=False,
-            audio_intent_started_monotonic=0.0,
             last_youtube_query=None,  # query/link fed back into Audio play
 
             # panic resume snapshot (what was active when panic engaged)
@@ -191,13 +288,29 @@ class UnifiedAudioRadio(commands.Cog):
             last_dj_youtube_request=None,
         )
 
-        self._stations_cache: List[Station] = []
-        self._http_lock = asyncio.Lock()
-        self._cache_lock = asyncio.Lock()
+        # Filtered search results by normalized query, most recent last. Each list is stored
+        # fresh and never mutated afterwards, so readers take the reference without copying.
+        # Every access runs without an await in between, so no lock is needed either.
+        self._stations_lru: "OrderedDict[str, List[Station]]" = OrderedDict()
+        # Radio Browser responses by request path: path -> (fetched_at monotonic, json)
+        self._rb_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # one lock per in-flight path so identical requests share a single fetch; the lock is
+        # dropped only when its holder and every queued waiter are done (count in _rb_keyusers)
+        self._rb_keylocks: Dict[str, asyncio.Lock] = {}
+        self._rb_keyusers: Dict[str, int] = {}
         self._autopanic_lock = asyncio.Lock()
 
-        self._watchdog_task: Optional[asyncio.Task] = None
-        self._reassure_task: Optional[asyncio.Task] = None
+        # In-process snapshot of the global Config scope. Loaded in cog_load and written
+        # through by _cset/_cfg_update; Config stays authoritative across restarts.
+        self._cfg: Dict[str, Any] = {}
+        self._cfg_loaded_at: float = 0.0
+        self._cfg_gen: int = 0  # bumped on every write-through
+        # values already in _cfg but not yet persisted (see _cfg_defer)
+        self._cfg_pending: Dict[str, Any] = {}
+        self._cfg_flush_task: Optional["asyncio.Task[Any]"] = None
+
+        # when the current audio intent began; process-local, so it is not persisted
+        self._audio_intent_started: float = 0.0
 
         self._allow_summon_until: float = 0.0
         self._home_grace_until: float = 0.0
@@ -205,8 +318,42 @@ class UnifiedAudioRadio(commands.Cog):
         self._last_reassure_in_vc_ts: float = 0.0
         self._last_reassure_out_vc_ts: float = 0.0
 
+        # Compiled blocklist (rebuilt only when block_tags_csv changes)
+        self._blocklist_csv: Optional[str] = None
+        self._blocklist_terms: Tuple[str, ...] = ()
+        self._blocklist_re: Optional["re.Pattern[str]"] = None
+        self._blocklist_ac: Optional[Any] = None  # pyahocorasick automaton, when installed
+
+        # Resolved text channels by Config key; re-resolved when the stored ID no longer matches
+        self._channel_memo: Dict[str, discord.TextChannel] = {}
+        self._control_channel_fetched: Optional[int] = None
+
+        # guild id -> (built at monotonic, _cfg_gen at build time, rrstatus embed)
+        self._status_cache: Dict[int, Tuple[float, int, discord.Embed]] = {}
+
+        # Voice client type -> attribute that yielded its channel ID / connected state
+        self._vc_id_attr: Dict[type, str] = {}
+        self._vc_conn_attr: Dict[type, str] = {}
+
+        # Audio command name -> in-perimeter bookkeeping handler (see on_command)
+        self._audio_dispatch: Dict[str, Callable[[commands.Context, float], Awaitable[None]]] = {}
+        for names, handler in (
+            (self.AUDIO_PLAY_ALIASES, self._on_audio_play),
+            (self.AUDIO_STOP_ALIASES, self._on_audio_stop),
+            (self.AUDIO_DISCONNECT_ALIASES, self._on_audio_disconnect),
+        ):
+            self._audio_dispatch.update(dict.fromkeys(names, handler))
+
+        # Resolved Audio commands (cleared whenever a cog is added/removed)
+        self._cmd_cache: Dict[str, commands.Command] = {}
+
+        # fire-and-forget work (SWR refreshes, voice rechecks, rest timer); cancelled on unload
+        self._bg_tasks: Set["asyncio.Task[Any]"] = set()
+
         # Lavalink event hook registration state (best-effort)
         self._ll_registered: bool = False
+        # lavalink module once imported; False once the import has failed
+        self._lavalink: Any = None
 
         # DJ presence tracking (for sleep/break nudges)
         self._dj_in_vc_since_monotonic: float = 0.0
@@ -224,13 +371,29 @@ class UnifiedAudioRadio(commands.Cog):
         # Rest end notification task
         self._rest_end_task: Optional[asyncio.Task] = None
 
+        # Reassurance embed templates (copied per send; only the description changes)
+        self._reassure_in_vc_tpl = discord.Embed(title="🖤 it's ok.", color=discord.Color.dark_teal())
+        self._reassure_in_vc_tpl.set_footer(text="Grey Hair Asuka protocol: reassurance (in vc).")
+        self._reassure_out_vc_tpl = discord.Embed(title="🖤 it's ok.", color=discord.Color.dark_teal())
+        self._reassure_out_vc_tpl.set_footer(text="Grey Hair Asuka protocol: reassurance (out of vc).")
+
     # -------------------------
     # Lavalink accessor
     # -------------------------
     def _get_lavalink(self):
+        # called from the watchdog and every track event; a failed import is not retried
+        if self._lavalink is None:
+            try:
+                import lavalink  # type: ignore
+                self._lavalink = lavalink
+            except Exception:
+                self._lavalink = False
+        return self._lavalink or None
+
+    def _get_ahocorasick(self):
         try:
-            import lavalink  # type: ignore
-            return lavalink
+            import ahocorasick  # type: ignore
+            return ahocorasick
         except Exception:
             return None
 
@@ -306,12 +469,17 @@ class UnifiedAudioRadio(commands.Cog):
             e.set_footer(text=self._grey_style(footer))
         return e
 
-    async def _dj_now_local(self):
+    def _grey_embed_from(self, template: discord.Embed, description: str) -> discord.Embed:
+        e = template.copy()
+        e.description = self._grey_style(description)
+        return e
+
+    def _dj_now_local(self):
         try:
             from datetime import datetime
             from zoneinfo import ZoneInfo
 
-            tzname = await self.config.dj_timezone()
+            tzname = self._cget("dj_timezone")
             tz = ZoneInfo(tzname or "America/New_York")
             return datetime.now(tz)
         except Exception:
@@ -327,16 +495,50 @@ class UnifiedAudioRadio(commands.Cog):
     def _parse_blocklist(self, csv: str) -> List[str]:
         return [t.strip().lower() for t in (csv or "").split(",") if t.strip()]
 
-    def _text_matches_blocklist(self, text: str, blocked: List[str]) -> bool:
-        blob = (text or "").lower()
-        return any(b in blob for b in blocked if b)
-
-    async def _blocked_terms(self) -> List[str]:
-        return self._parse_blocklist(await self.config.block_tags_csv())
+    def _blocklist(self) -> Tuple[str, ...]:
+        csv = self._cget("block_tags_csv") or ""
+        if csv != self._blocklist_csv:
+            # dedupe, keeping order, so repeated CSV entries are not scanned twice per station
+            terms = tuple(dict.fromkeys(self._parse_blocklist(csv)))
+            self._blocklist_terms = terms
+            self._blocklist_re = re.compile("|".join(map(re.escape, terms))) if terms else None
+            self._blocklist_ac = None
+            ac = self._get_ahocorasick() if len(terms) > SMALL_BLOCKLIST else None
+            if ac:
+                automaton = ac.Automaton()
+                for t in terms:
+                    automaton.add_word(t, t)
+                automaton.make_automaton()
+                self._blocklist_ac = automaton
+            self._blocklist_csv = csv
+        return self._blocklist_terms
+
+    def _text_matches_blocklist(self, text: str) -> bool:
+        return bool(text) and self._blob_matches_blocklist(text.lower())
+
+    def _blob_matches_blocklist(self, blob: str) -> bool:
+        """Like _text_matches_blocklist, for text that is already lowercased."""
+        terms = self._blocklist()
+        if not terms or not blob:
+            return False
+        if len(terms) <= SMALL_BLOCKLIST:
+            return any(t in blob for t in terms)
+        if self._blocklist_ac is not None:
+            return next(self._blocklist_ac.iter(blob), None) is not None
+        return self._blocklist_re.search(blob) is not None  # type: ignore[union-attr]
 
     # -------------------------
     # Lavalink / Audio track metadata access (best-effort)
     # -------------------------
+    @staticmethod
+    def _track_fields(obj: Any, names: Tuple[str, ...]) -> List[str]:
+        """Non-empty `names` of a track object: dict keys for dicts, attributes otherwise."""
+        if isinstance(obj, dict):
+            values = [obj.get(n) for n in names]
+        else:
+            values = [getattr(obj, n, None) for n in names]
+        return [str(v) for v in values if v]
+
     def _current_track_text_from_audio(self, guild: discord.Guild) -> str:
         parts: List[str] = []
 
@@ -350,30 +552,16 @@ class UnifiedAudioRadio(commands.Cog):
                     or getattr(player, "track", None)
                 )
                 if cur:
-                    for attr in ("title", "author", "uri", "identifier", "track_identifier", "source", "url"):
-                        v = getattr(cur, attr, None)
-                        if v:
-                            parts.append(str(v))
-                    if isinstance(cur, dict):
-                        for k in ("title", "author", "uri", "identifier", "source", "url"):
-                            if cur.get(k):
-                                parts.append(str(cur.get(k)))
+                    parts.extend(self._track_fields(cur, _TRACK_ATTRS))
             except Exception:
                 pass
 
         vc = guild.voice_client
         if vc:
-            for attr in ("current", "current_track", "track", "now_playing", "playing"):
+            for attr in _VC_TRACK_HOLDERS:
                 obj = getattr(vc, attr, None)
                 if obj:
-                    for k in ("title", "author", "uri", "identifier", "source", "url"):
-                        v = getattr(obj, k, None)
-                        if v:
-                            parts.append(str(v))
-                    if isinstance(obj, dict):
-                        for k in ("title", "author", "uri", "identifier", "source", "url"):
-                            if obj.get(k):
-                                parts.append(str(obj.get(k)))
+                    parts.extend(self._track_fields(obj, _TRACK_KEYS))
 
         return " ".join(parts).strip()
 
@@ -403,12 +591,12 @@ class UnifiedAudioRadio(commands.Cog):
         try:
             if not self._track_start_eventish(event):
                 return
-            if not await self.config.bound():
+            if not self._cget("bound"):
                 return
-            if await self.config.panic_locked() or await self.config.suspended():
+            if self._cget("panic_locked") or self._cget("suspended"):
                 return
 
-            allowed_guild_id = await self.config.allowed_guild_id()
+            allowed_guild_id = self._cget("allowed_guild_id")
             if not allowed_guild_id:
                 return
 
@@ -418,18 +606,17 @@ class UnifiedAudioRadio(commands.Cog):
             except Exception:
                 return
 
-            if int(allowed_guild_id) != pgid_int:
+            if allowed_guild_id != pgid_int:
                 return
 
             guild = self.bot.get_guild(pgid_int)
             if not guild:
                 return
 
-            if not await self.config.audio_intent_active():
+            if not self._cget("audio_intent_active"):
                 return
 
-            blocked = await self._blocked_terms()
-            if not blocked:
+            if not self._blocklist():
                 return
 
             cur = getattr(player, "current", None) or getattr(player, "current_track", None) or getattr(player, "track", None)
@@ -445,7 +632,7 @@ class UnifiedAudioRadio(commands.Cog):
             if not blob:
                 return
 
-            if self._text_matches_blocklist(blob, blocked):
+            if self._text_matches_blocklist(blob):
                 ll = self._get_lavalink()
                 if ll:
                     try:
@@ -459,9 +646,7 @@ class UnifiedAudioRadio(commands.Cog):
                     except Exception:
                         pass
 
-                await self._clear_radio_state()
-                await self._clear_audio_intent()
-                await self._set_presence(None)
+                await self._reset_playback_state()
 
                 await self._audit_security(guild, "Blocked track (lavalink TRACK_START filter)")
                 await self._notify_control(
@@ -477,15 +662,21 @@ class UnifiedAudioRadio(commands.Cog):
     # Red lifecycle
     # -------------------------
     async def cog_load(self) -> None:
+        await self._refresh_cfg()
+
         if self.http is None or self.http.closed:
             timeout = aiohttp.ClientTimeout(total=18)
-            self.http = aiohttp.ClientSession(timeout=timeout, headers={"User-Agent": USER_AGENT})
-
-        if self._watchdog_task is None or self._watchdog_task.done():
-            self._watchdog_task = self.bot.loop.create_task(self._watchdog_loop())
+            connector = aiohttp.TCPConnector(
+                limit=32, limit_per_host=8, keepalive_timeout=75, ttl_dns_cache=300
+            )
+            self.http = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+            )
 
-        if self._reassure_task is None or self._reassure_task.done():
-            self._reassure_task = self.bot.loop.create_task(self._periodic_reassurance_loop())
+        if not self._tick.is_running():
+            self._tick.start()
 
         if not self._ll_registered:
             ll = self._get_lavalink()
@@ -499,9 +690,7 @@ class UnifiedAudioRadio(commands.Cog):
                 log.warning("Lavalink module not available; track-start filtering will be disabled.")
 
     def cog_unload(self):
-        for t in (self._watchdog_task, self._reassure_task):
-            if t and not t.done():
-                t.cancel()
+        self._tick.cancel()
 
         self._cancel_rest_end_task()
 
@@ -514,13 +703,36 @@ class UnifiedAudioRadio(commands.Cog):
                     pass
             self._ll_registered = False
 
-        if self.http and not self.http.closed:
-            self.bot.loop.create_task(self._close_http())
+        pending = [t for t in self._bg_tasks if not t.done()]
+        for t in pending:
+            t.cancel()
+        if pending or self._cfg_pending or (self.http and not self.http.closed):
+            self.bot.loop.create_task(self._shutdown(pending))
+
+    def _spawn(self, coro: Awaitable[Any]) -> "asyncio.Task[Any]":
+        task = self.bot.loop.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    async def _shutdown(self, pending: List["asyncio.Task[Any]"]) -> None:
+        """Let cancelled background tasks unwind, then close the session they may be using."""
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        try:
+            await self._cfg_flush()
+        except Exception:
+            log.exception("Failed to flush deferred Config writes on unload")
+        await self._close_http()
 
     async def _close_http(self):
         try:
             if self.http and not self.http.closed:
+                connector = self.http.connector
                 await self.http.close()
+                # the session owns it, but close explicitly so pooled keep-alive sockets never outlive unload
+                if connector is not None and not connector.closed:
+                    await connector.close()
         except Exception:
             pass
 
@@ -532,43 +744,81 @@ class UnifiedAudioRadio(commands.Cog):
     # -------------------------
     # Voice abstraction
     # -------------------------
+    # discord.VoiceClient gets a direct path; anything else (Lavalink players) falls through to probing
     def _vc_connected(self, vc) -> bool:
         if vc is None:
             return False
-        meth = getattr(vc, "is_connected", None)
-        if callable(meth):
+        if isinstance(vc, discord.VoiceClient):
+            return vc.is_connected()
+        cls = type(vc)
+        known = self._vc_conn_attr.get(cls)
+        if known is not None:
+            val = self._vc_conn_via(vc, known)
+            if val is not None:
+                return val
+        for attr in ("is_connected", "connected"):
+            val = self._vc_conn_via(vc, attr)
+            if val is not None:
+                self._vc_conn_attr[cls] = attr
+                return val
+        return False
+
+    @staticmethod
+    def _vc_conn_via(vc, attr: str) -> Optional[bool]:
+        v = getattr(vc, attr, None)
+        if isinstance(v, bool):
+            return v
+        if callable(v):
             try:
-                return bool(meth())
+                return bool(v())
             except Exception:
                 return False
-        val = getattr(vc, "connected", None)
-        if isinstance(val, bool):
-            return val
-        val2 = getattr(vc, "is_connected", None)
-        if isinstance(val2, bool):
-            return val2
-        return False
+        return None
 
     def _vc_channel_id(self, vc) -> Optional[int]:
         if vc is None:
             return None
-        ch = getattr(vc, "channel", None)
-        if ch is not None and hasattr(ch, "id"):
+        if isinstance(vc, discord.VoiceClient):
+            return vc.channel.id if vc.channel else None
+        cls = type(vc)
+        known = self._vc_id_attr.get(cls)
+        if known is not None:
+            cid = self._vc_id_via(vc, known)
+            if cid is not None:
+                return cid
+        for attr in ("channel", "channel_id", "voice_channel_id"):
+            cid = self._vc_id_via(vc, attr)
+            if cid is not None:
+                # remember which accessor works for this client type; later calls try it first
+                self._vc_id_attr[cls] = attr
+                return cid
+        return None
+
+    @staticmethod
+    def _vc_id_via(vc, attr: str) -> Optional[int]:
+        v = getattr(vc, attr, None)
+        if attr == "channel":
+            if v is None or not hasattr(v, "id"):
+                return None
             try:
-                return int(ch.id)
+                return int(v.id)
             except Exception:
-                pass
-        for attr in ("channel_id", "voice_channel_id"):
-            v = getattr(vc, attr, None)
-            if isinstance(v, int):
-                return v
-            if isinstance(v, str) and v.isdigit():
-                return int(v)
+                return None
+        if isinstance(v, int):
+            return v
+        if isinstance(v, str) and v.isdigit():
+            return int(v)
         return None
 
     async def _vc_disconnect(self, vc) -> None:
         if vc is None:
             return
+        if isinstance(vc, discord.VoiceClient):
+            try:
+                await vc.disconnect(force=True)
+            except Exception:
+                pass
+            return
         disc = getattr(vc, "disconnect", None)
         if callable(disc):
             try:
@@ -592,6 +842,8 @@ class UnifiedAudioRadio(commands.Cog):
 
     def _player_is_playing(self, guild: discord.Guild) -> bool:
         p = guild.voice_client
+        if isinstance(p, discord.VoiceClient):
+            return p.is_playing()
         v = getattr(p, "is_playing", None)
         if isinstance(v, bool):
             return v
@@ -605,30 +857,97 @@ class UnifiedAudioRadio(commands.Cog):
     # -------------------------
     # State helpers
     # -------------------------
-    async def _radio_active(self) -> bool:
-        return bool(await self.config.stream_url() and await self.config.station_name())
+    async def _refresh_cfg(self) -> None:
+        gen = self._cfg_gen
+        fresh = await self.config.all()
+        # IDs are compared against discord ints everywhere; coerce anything stored loosely once here
+        for key in ID_KEYS:
+            v = fresh.get(key)
+            if v is not None and not isinstance(v, int):
+                try:
+                    fresh[key] = int(v)
+                except (TypeError, ValueError):
+                    fresh[key] = None
+        # a write that landed while we were reading is newer than `fresh`; retry next tick
+        if gen == self._cfg_gen:
+            fresh.update(self._cfg_pending)
+            self._cfg = fresh
+            self._cfg_loaded_at = time.monotonic()
+
+    def _cget(self, key: str, default: Any = None) -> Any:
+        return self._cfg.get(key, default)
+
+    async def _cset(self, key: str, value: Any) -> None:
+        if self._cfg_pending:
+            # carry deferred values along instead of leaving them behind this write
+            await self._cfg_update(**{key: value})
+            return
+        await getattr(self.config, key).set(value)
+        self._cfg[key] = value
+        self._cfg_gen += 1
+
+    async def _cfg_update(self, **values: Any) -> None:
+        """Write several global keys in a single Config transaction (plus anything deferred)."""
+        pending = dict(self._cfg_pending)
+        async with self.config.all() as cfg:
+            cfg.update(pending)
+            cfg.update(values)
+        # committed: drop the deferred values just written, unless a newer one arrived meanwhile.
+        # If the write raised, they are all still queued for the next attempt.
+        for k, v in pending.items():
+            if k in self._cfg_pending and self._cfg_pending[k] == v:
+                del self._cfg_pending[k]
+        self._cfg.update(values)
+        self._cfg.update(self._cfg_pending)  # newer deferred values still win in the snapshot
+        self._cfg_gen += 1
+
+    def _cfg_defer(self, **values: Any) -> None:
+        """Update the snapshot now; persist with the next write or after CFG_FLUSH_DELAY."""
+        self._cfg.update(values)
+        self._cfg_pending.update(values)
+        self._cfg_gen += 1
+        if self._cfg_flush_task is None or self._cfg_flush_task.done():
+            self._cfg_flush_task = self._spawn(self._cfg_flush_later())
+
+    async def _cfg_flush_later(self) -> None:
+        # loop: values deferred while a flush is awaiting Config, or left by a failed one,
+        # still need a flush of their own
+        while self._cfg_pending:
+            await asyncio.sleep(CFG_FLUSH_DELAY)
+            try:
+                await self._cfg_flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                log.exception("Deferred Config flush failed; retrying in %ss", CFG_FLUSH_DELAY)
 
-    async def _audio_intent_active(self) -> bool:
-        return bool(await self.config.audio_intent_active())
+    async def _cfg_flush(self) -> None:
+        if self._cfg_pending:
+            await self._cfg_update()
 
-    async def _any_active(self, guild: Optional[discord.Guild] = None) -> bool:
-        if await self._radio_active():
-            return True
-        if await self._audio_intent_active():
-            return True
-        if guild and self._player_is_playing(guild):
-            return True
-        return False
+    def _radio_active(self) -> bool:
+        return bool(self._cget("stream_url") and self._cget("station_name"))
+
+    def _audio_intent_active(self) -> bool:
+        return bool(self._cget("audio_intent_active"))
+
+    def _any_active(self, guild: Optional[discord.Guild] = None) -> bool:
+        # snapshot reads only: plain methods, so watchdog/voice paths don't build coroutines
+        return (
+            self._radio_active()
+            or self._audio_intent_active()
+            or bool(guild and self._player_is_playing(guild))
+        )
 
-    async def _bot_is_home(self, guild: discord.Guild) -> bool:
-        allowed_vc_id = await self.config.allowed_voice_channel_id()
+    def _bot_is_home(self, guild: discord.Guild) -> bool:
+        allowed_vc_id = self._cget("allowed_voice_channel_id")
         if not allowed_vc_id:
             return False
         vc = guild.voice_client
         if not self._vc_connected(vc):
             return False
         cid = self._vc_channel_id(vc)
-        return bool(cid and int(cid) == int(allowed_vc_id))
+        return cid == allowed_vc_id
 
     # -------------------------
     # Restore / resume memory helpers
@@ -645,39 +964,50 @@ class UnifiedAudioRadio(commands.Cog):
         except Exception:
             return None
 
-    async def _snapshot_for_panic(self, guild: discord.Guild) -> None:
+    def _panic_snapshot_values(self, guild: discord.Guild) -> Dict[str, Any]:
+        """panic_resume_* values describing what to resume after unlock (all None if nothing)."""
+        snap: Dict[str, Any] = dict.fromkeys(PANIC_SNAPSHOT_KEYS)
         try:
-            if await self._radio_active():
-                sn = await self.config.station_name()
-                su = await self.config.stream_url()
-                await self.config.panic_resume_kind.set("radio")
-                await self.config.panic_resume_station_name.set(sn)
-                await self.config.panic_resume_station_url.set(su)
-                await self.config.panic_resume_youtube_query.set(None)
-                return
+            if self._radio_active():
+                snap["panic_resume_kind"] = "radio"
+                snap["panic_resume_station_name"] = self._cget("station_name")
+                snap["panic_resume_station_url"] = self._cget("stream_url")
+                return snap
 
-            audio_intent = await self.config.audio_intent_active()
+            audio_intent = self._cget("audio_intent_active")
             playing = self._player_is_playing(guild)
-            yt = await self.config.last_youtube_query()
+            yt = self._cget("last_youtube_query")
             if (audio_intent or playing) and yt:
-                await self.config.panic_resume_kind.set("youtube")
-                await self.config.panic_resume_youtube_query.set(yt)
-                await self.config.panic_resume_station_name.set(None)
-                await self.config.panic_resume_station_url.set(None)
-                return
-
-            await self.config.panic_resume_kind.set(None)
-            await self.config.panic_resume_station_name.set(None)
-            await self.config.panic_resume_station_url.set(None)
-            await self.config.panic_resume_youtube_query.set(None)
+                snap["panic_resume_kind"] = "youtube"
+                snap["panic_resume_youtube_query"] = yt
         except Exception:
             pass
+        return snap
+
+    async def _engage_panic(self, guild: discord.Guild, reason: str) -> None:
+        """Snapshot, lock and clear playback state in one Config write, then leave voice."""
+        await self._cfg_update(
+            **self._panic_snapshot_values(guild),
+            panic_locked=True,
+            autopanic_reason=reason,
+            stream_url=None,
+            station_name=None,
+            audio_intent_active=False,
+        )
+
+        # lock is persisted above; the remaining teardown is independent
+        await asyncio.gather(
+            self._vc_disconnect(guild.voice_client), self._set_presence(None), return_exceptions=True
+        )
+
+    def _panic_snapshot_present(self) -> bool:
+        return any(self._cget(k) is not None for k in PANIC_SNAPSHOT_KEYS)
 
     async def _clear_panic_snapshot(self) -> None:
-        await self.config.panic_resume_kind.set(None)
-        await self.config.panic_resume_station_name.set(None)
-        await self.config.panic_resume_station_url.set(None)
-        await self.config.panic_resume_youtube_query.set(None)
+        # common unlock path has nothing saved; skip the no-op write
+        if not self._panic_snapshot_present():
+            return
+        await self._cfg_update(**dict.fromkeys(PANIC_SNAPSHOT_KEYS))
 
     # -------------------------
     # Audit / notify
@@ -685,21 +1015,46 @@ class UnifiedAudioRadio(commands.Cog):
     async def _audit_security(self, guild: discord.Guild, reason: str) -> None:
         try:
             log.warning("[SECURITY] %s | guild=%s (%s)", reason, guild.name, guild.id)
-            audit_channel_id = await self.config.audit_channel_id()
-            if audit_channel_id:
-                ch = guild.get_channel(int(audit_channel_id))
-                if ch:
-                    embed = discord.Embed(title="🛡️ Security", description=reason, color=discord.Color.orange())
-                    await ch.send(embed=embed)
+            ch = self._memo_text_channel(guild, "audit_channel_id")
+            if ch:
+                embed = discord.Embed(title="🛡️ Security", description=reason, color=discord.Color.orange())
+                await ch.send(embed=embed)
         except Exception:
             pass
 
+    def _memo_text_channel(self, guild: discord.Guild, key: str) -> Optional[discord.TextChannel]:
+        """Cache-only lookup of the text channel whose ID is stored under Config `key`."""
+        cid = self._cget(key)
+        if not cid:
+            return None
+        ch = self._channel_memo.get(key)
+        if ch is not None and ch.id == cid and ch.guild.id == guild.id:
+            return ch
+        ch = guild.get_channel(cid)
+        if not isinstance(ch, discord.TextChannel):
+            return None
+        self._channel_memo[key] = ch
+        return ch
+
     async def _control_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
-        cid = await self.config.control_text_channel_id()
+        ch = self._memo_text_channel(guild, "control_text_channel_id")
+        if ch is not None:
+            return ch
+        cid = self._cget("control_text_channel_id")
         if not cid:
             return None
-        ch = guild.get_channel(int(cid))
-        return ch if isinstance(ch, discord.TextChannel) else None
+        if not self.bot.is_ready() or self._control_channel_fetched == cid:
+            return None
+        # cache miss after READY: allow one REST lookup per stored ID, not one per message
+        self._control_channel_fetched = cid
+        try:
+            ch = await guild.fetch_channel(cid)
+        except discord.HTTPException:
+            return None
+        if not isinstance(ch, discord.TextChannel):
+            return None
+        self._channel_memo["control_text_channel_id"] = ch
+        return ch
 
     async def _notify_control(self, guild: discord.Guild, title: str, description: str, color: discord.Color):
         try:
@@ -721,21 +1076,26 @@ class UnifiedAudioRadio(commands.Cog):
             pass
 
     async def _suspend(self, reason: str) -> None:
-        await self.config.suspended.set(True)
-        await self.config.suspend_reason.set(reason)
+        await self._cfg_update(suspended=True, suspend_reason=reason)
         await self._set_presence(None)
 
     async def _unsuspend(self) -> None:
-        await self.config.suspended.set(False)
-        await self.config.suspend_reason.set(None)
+        await self._cfg_update(suspended=False, suspend_reason=None)
 
     async def _clear_radio_state(self) -> None:
-        await self.config.stream_url.set(None)
-        await self.config.station_name.set(None)
+        await self._cfg_update(stream_url=None, station_name=None)
 
     async def _clear_audio_intent(self) -> None:
-        await self.config.audio_intent_active.set(False)
-        await self.config.audio_intent_started_monotonic.set(0.0)
+        await self._cfg_update(audio_intent_active=False)
+
+    async def _reset_playback_state(self, presence: Optional[str] = None) -> None:
+        """Clear radio + audio intent in one Config write, then set presence once."""
+        await self._cfg_update(
+            stream_url=None,
+            station_name=None,
+            audio_intent_active=False,
+        )
+        await self._set_presence(presence)
 
     async def _hard_stop_and_leave(self, guild: discord.Guild) -> None:
         """
@@ -760,61 +1120,46 @@ class UnifiedAudioRadio(commands.Cog):
         except Exception:
             pass
 
-        await self._clear_radio_state()
-        await self._clear_audio_intent()
-        await self._set_presence(None)
+        await self._reset_playback_state()
 
     async def _autopanic(self, guild: discord.Guild, reason: str) -> None:
-        if not await self.config.autopanic_enabled():
+        if not self._cget("autopanic_enabled"):
             return
         async with self._autopanic_lock:
-            if await self.config.panic_locked():
+            if self._cget("panic_locked"):
                 return
 
-            await self._snapshot_for_panic(guild)
-
-            await self.config.panic_locked.set(True)
-            await self.config.autopanic_reason.set(reason)
-
-            try:
-                await self._vc_disconnect(guild.voice_client)
-            except Exception:
-                pass
+            await self._engage_panic(guild, reason)
 
-            await self._clear_radio_state()
-            await self._clear_audio_intent()
-            await self._set_presence(None)
-
-            await self._audit_security(guild, f"Auto-panic: {reason}")
-            await self._notify_control(
-                guild,
-                "🛑 Panic Engaged",
-                f"{reason}\n\nSafe recovery:\n"
-                f"1) `rrunlock` (home-only)\n"
-                f"2) optionally `rrunlock radio` OR `rrunlock resume`",
-                discord.Color.red(),
+            await asyncio.gather(
+                self._audit_security(guild, f"Auto-panic: {reason}"),
+                self._notify_control(
+                    guild,
+                    "🛑 Panic Engaged",
+                    f"{reason}\n\nSafe recovery:\n"
+                    f"1) `rrunlock` (home-only)\n"
+                    f"2) optionally `rrunlock radio` OR `rrunlock resume`",
+                    discord.Color.red(),
+                ),
             )
 
     # -------------------------
     # DJ messaging (DM-first)
     # -------------------------
     async def _send_to_dj(self, guild: discord.Guild, embed: discord.Embed) -> None:
-        dj_user_id = await self.config.dj_user_id()
+        dj_user_id = self._cget("dj_user_id")
         if not dj_user_id:
             return
-        member = guild.get_member(int(dj_user_id))
+        member = guild.get_member(dj_user_id)
         if not member:
             return
 
         use_dm = True
         try:
-            use_dm = bool(await self.config.reassure_use_dm())
+            use_dm = bool(self._cget("reassure_use_dm"))
         except Exception:
             use_dm = True
 
-        fallback_id = await self.config.reassure_fallback_channel_id()
-        control_id = await self.config.control_text_channel_id()
-
         if use_dm:
             try:
                 await member.send(embed=embed)
@@ -822,12 +1167,10 @@ class UnifiedAudioRadio(commands.Cog):
             except Exception:
                 pass
 
-        ch = None
-        if fallback_id:
-            ch = guild.get_channel(int(fallback_id))
-        if ch is None and control_id:
-            ch = guild.get_channel(int(control_id))
-        if not isinstance(ch, discord.TextChannel):
+        ch = self._memo_text_channel(guild, "reassure_fallback_channel_id") or self._memo_text_channel(
+            guild, "control_text_channel_id"
+        )
+        if ch is None:
             return
 
         try:
@@ -839,20 +1182,20 @@ class UnifiedAudioRadio(commands.Cog):
         """
         Best-effort DM ping to Grey Hair Asuka (bound owner), so she's alerted even if control channel is missed.
         """
-        owner_id = await self.config.bound_owner_user_id()
+        owner_id = self._cget("bound_owner_user_id")
         if not owner_id:
             return
 
-        member = guild.get_member(int(owner_id))
+        member = guild.get_member(owner_id)
         if member is None:
             try:
-                member = await guild.fetch_member(int(owner_id))
+                member = await guild.fetch_member(owner_id)
             except Exception:
                 member = None
 
         if member is None:
             try:
-                user = self.bot.get_user(int(owner_id)) or await self.bot.fetch_user(int(owner_id))
+                user = self.bot.get_user(owner_id) or await self.bot.fetch_user(owner_id)
             except Exception:
                 user = None
             if user:
@@ -868,9 +1211,9 @@ class UnifiedAudioRadio(commands.Cog):
             pass
 
     async def _dj_youtube_started(self, guild: discord.Guild):
-        if not await self.config.dj_notify_youtube_start():
+        if not self._cget("dj_notify_youtube_start"):
             return
-        last_station = await self.config.last_station_name()
+        last_station = self._cget("last_station_name")
         line = f"last radio saved: **{last_station}**" if last_station else "radio state saved."
         embed = self._grey_embed(
             title="🖤 it's ok.",
@@ -880,9 +1223,9 @@ class UnifiedAudioRadio(commands.Cog):
         await self._send_to_dj(guild, embed)
 
     async def _dj_youtube_stopped(self, guild: discord.Guild):
-        if not await self.config.dj_notify_youtube_stop():
+        if not self._cget("dj_notify_youtube_stop"):
             return
-        last_station = await self.config.last_station_name()
+        last_station = self._cget("last_station_name")
         msg = (
             f"youtube stopped.\nif you want radio back: **g!djradio**\nlast station: **{last_station}**"
             if last_station
@@ -896,7 +1239,7 @@ class UnifiedAudioRadio(commands.Cog):
         await self._send_to_dj(guild, embed)
 
     async def _dj_sleep_reminder(self, guild: discord.Guild, minutes_in_vc: int, level: int):
-        local = await self._dj_now_local()
+        local = self._dj_now_local()
         if local is not None:
             try:
                 hhmm = local.strftime("%-I:%M %p")
@@ -951,11 +1294,15 @@ class UnifiedAudioRadio(commands.Cog):
     # -------------------------
     # Rest enforcement (anti-cheat) + rest-end ping
     # -------------------------
-    async def _rest_active(self) -> bool:
-        return time.monotonic() < float(self._rest_until_monotonic or 0.0)
+    def _rest_active(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        return now < float(self._rest_until_monotonic or 0.0)
 
-    def _rest_remaining_minutes(self) -> int:
-        rem = max(0.0, float(self._rest_until_monotonic or 0.0) - time.monotonic())
+    def _rest_remaining_minutes(self, now: Optional[float] = None) -> int:
+        if now is None:
+            now = time.monotonic()
+        rem = max(0.0, float(self._rest_until_monotonic or 0.0) - now)
         return int((rem + 59.0) // 60.0)
 
     def _cancel_rest_end_task(self) -> None:
@@ -971,8 +1318,9 @@ class UnifiedAudioRadio(commands.Cog):
             try:
                 await asyncio.sleep(max(1, int(mins)) * 60)
 
-                if await self._rest_active():
-                    rem = max(0.0, float(self._rest_until_monotonic or 0.0) - time.monotonic())
+                now = time.monotonic()
+                if self._rest_active(now):
+                    rem = max(0.0, float(self._rest_until_monotonic or 0.0) - now)
                     if rem > 0:
                         await asyncio.sleep(rem)
 
@@ -998,23 +1346,23 @@ class UnifiedAudioRadio(commands.Cog):
             except Exception:
                 log.exception("rest end notice task error")
 
-        self._rest_end_task = self.bot.loop.create_task(_runner())
+        self._rest_end_task = self._spawn(_runner())
 
     async def _enforce_rest_if_needed(self, guild: discord.Guild, dj_in_allowed_vc: bool) -> None:
         if not dj_in_allowed_vc:
             return
-        if not await self.config.dj_rest_enabled():
+        if not self._cget("dj_rest_enabled"):
             return
-        if not await self._rest_active():
+        now = time.monotonic()
+        if not self._rest_active(now):
             return
 
-        now = time.monotonic()
         if self._last_rest_enforce_monotonic and (now - self._last_rest_enforce_monotonic) < 20.0:
             return
         self._last_rest_enforce_monotonic = now
 
-        mode = (await self.config.dj_rest_enforce_mode() or "leave").strip().lower()
-        rem_mins = self._rest_remaining_minutes()
+        mode = (self._cget("dj_rest_enforce_mode") or "leave").strip().lower()
+        rem_mins = self._rest_remaining_minutes(now)
 
         self._set_grey_fatigue(max(self._grey_fatigue_level, 0.85))
 
@@ -1031,9 +1379,7 @@ class UnifiedAudioRadio(commands.Cog):
                         pass
             except Exception:
                 pass
-            await self._clear_radio_state()
-            await self._clear_audio_intent()
-            await self._set_presence(None)
+            await self._reset_playback_state()
         else:
             await self._hard_stop_and_leave(guild)
 
@@ -1061,10 +1407,10 @@ class UnifiedAudioRadio(commands.Cog):
         )
 
         # Alert Grey Hair Asuka (owner) + control channel so she's watching for anything
-        if await self.config.dj_rest_notify_owner():
+        if self._cget("dj_rest_notify_owner"):
             control = await self._control_channel(guild)
-            owner_id = await self.config.bound_owner_user_id()
-            owner_mention = f"<@{int(owner_id)}>" if owner_id else "@owner"
+            owner_id = self._cget("bound_owner_user_id")
+            owner_mention = f"<@{owner_id}>" if owner_id else "@owner"
 
             embed = discord.Embed(
                 title="🛌 Rest Enforcement Triggered",
@@ -1096,11 +1442,11 @@ class UnifiedAudioRadio(commands.Cog):
 
         # DJ commands
         if cmd in ("djradio", "djyoutube", "imgoing"):
-            allowed_guild_id = await self.config.allowed_guild_id()
-            dj_user_id = await self.config.dj_user_id()
-            if allowed_guild_id and ctx.guild.id != int(allowed_guild_id):
+            allowed_guild_id = self._cget("allowed_guild_id")
+            dj_user_id = self._cget("dj_user_id")
+            if allowed_guild_id and ctx.guild.id != allowed_guild_id:
                 return False
-            return bool(dj_user_id and ctx.author.id == int(dj_user_id))
+            return bool(dj_user_id and ctx.author.id == dj_user_id)
 
         # Owner-only everywhere else
         try:
@@ -1112,15 +1458,15 @@ class UnifiedAudioRadio(commands.Cog):
 
         # Allow bind/move before bound
         prebind_ok = {"rrbind", "rrstatus", "rrmove", "rrmigrate", "rrrebindex"}
-        if not await self.config.bound():
+        if not self._cget("bound"):
             if cmd in prebind_ok:
                 return True
             await ctx.send(f"Locked. Bind first with `{ctx.clean_prefix}rrbind`.")
             return False
 
-        allowed_guild_id = await self.config.allowed_guild_id()
+        allowed_guild_id = self._cget("allowed_guild_id")
         # Allow server migration even if currently bound to another guild
-        if allowed_guild_id and ctx.guild.id != int(allowed_guild_id):
+        if allowed_guild_id and ctx.guild.id != allowed_guild_id:
             if cmd in {"rrmove", "rrmigrate", "rrrebindex"}:
                 return True
             await self._audit_security(ctx.guild, f"Denied: wrong guild ({ctx.guild.id})")
@@ -1138,13 +1484,13 @@ class UnifiedAudioRadio(commands.Cog):
             "rrmigrate",
             "rrrebindex",
         }
-        control_id = await self.config.control_text_channel_id()
-        if control_id and ctx.channel.id != int(control_id):
+        control_id = self._cget("control_text_channel_id")
+        if control_id and ctx.channel.id != control_id:
             if cmd not in bypass_control:
                 await self._audit_security(ctx.guild, f"Denied: outside control channel ({ctx.channel.id})")
                 return False
 
-        if await self.config.panic_locked():
+        if self._cget("panic_locked"):
             panic_ok = {"rrstatus", "rrunlock", "rrpanic", "rrcontrol", "rrhard", "rrmove", "rrmigrate", "rrrebindex"}
             if cmd in panic_ok:
                 return True
@@ -1154,7 +1500,7 @@ class UnifiedAudioRadio(commands.Cog):
         return True
 
     async def _require_owner_in_allowed_vc(self, ctx: commands.Context) -> bool:
-        allowed_vc_id = await self.config.allowed_voice_channel_id()
+        allowed_vc_id = self._cget("allowed_voice_channel_id")
         if not allowed_vc_id:
             await ctx.send("Voice lock is not set. Rebind with rrbind.")
             return False
@@ -1163,7 +1509,7 @@ class UnifiedAudioRadio(commands.Cog):
             await ctx.send("Get in the locked voice channel first.")
             return False
 
-        if ctx.author.voice.channel.id != int(allowed_vc_id):
+        if ctx.author.voice.channel.id != allowed_vc_id:
             await ctx.send("Wrong voice channel.")
             await self._audit_security(ctx.guild, f"Denied: owner not in allowed VC ({ctx.author.voice.channel.id})")
             return False
@@ -1173,16 +1519,46 @@ class UnifiedAudioRadio(commands.Cog):
     async def _require_bot_home(self, ctx: commands.Context) -> bool:
         if not ctx.guild:
             return False
-        if not await self._bot_is_home(ctx.guild):
+        if not self._bot_is_home(ctx.guild):
             await ctx.send("Bot is not home. Use `rrhome` while you are in the locked VC.")
             return False
         return True
 
+    async def _gates(self, ctx: commands.Context, suspended_msg: str = "Suspended. Use `rrresume`.") -> bool:
+        """Shared playback prologue: owner in locked VC, bot home, not suspended."""
+        if not await self._require_owner_in_allowed_vc(ctx):
+            return False
+        if not await self._require_bot_home(ctx):
+            return False
+        if self._cget("suspended"):
+            await ctx.send(suspended_msg)
+            return False
+        return True
+
     # -------------------------
     # Audio wrappers
     # -------------------------
     def _get_cmd(self, name: str):
-        return self.bot.get_command(name)
+        cmd = self._cmd_cache.get(name)
+        if cmd is None:
+            cmd = self.bot.get_command(name)
+            if cmd is not None:
+                self._cmd_cache[name] = cmd
+        return cmd
+
+    @commands.Cog.listener()
+    async def on_cog_add(self, cog: commands.Cog):
+        self._cmd_cache.clear()
+
+    @commands.Cog.listener()
+    async def on_cog_remove(self, cog: commands.Cog):
+        self._cmd_cache.clear()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        for key, ch in list(self._channel_memo.items()):
+            if ch.id == channel.id:
+                del self._channel_memo[key]
 
     async def _invoke_audio(self, ctx: commands.Context, name: str, **kwargs) -> Tuple[bool, str]:
         cmd = self._get_cmd(name)
@@ -1217,11 +1593,11 @@ class UnifiedAudioRadio(commands.Cog):
     async def _audio_cmd_is_allowed(self, ctx: commands.Context) -> bool:
         if not ctx.guild:
             return False
-        if not await self.config.bound():
+        if not self._cget("bound"):
             return False
 
-        allowed_guild_id = await self.config.allowed_guild_id()
-        if allowed_guild_id and ctx.guild.id != int(allowed_guild_id):
+        allowed_guild_id = self._cget("allowed_guild_id")
+        if allowed_guild_id and ctx.guild.id != allowed_guild_id:
             return False
 
         try:
@@ -1231,16 +1607,16 @@ class UnifiedAudioRadio(commands.Cog):
         if not is_owner:
             return False
 
-        control_id = await self.config.control_text_channel_id()
-        if control_id and ctx.channel.id != int(control_id):
+        control_id = self._cget("control_text_channel_id")
+        if control_id and ctx.channel.id != control_id:
             return False
 
-        allowed_vc_id = await self.config.allowed_voice_channel_id()
+        allowed_vc_id = self._cget("allowed_voice_channel_id")
         if not allowed_vc_id:
             return False
         if not ctx.author.voice or not ctx.author.voice.channel:
             return False
-        if ctx.author.voice.channel.id != int(allowed_vc_id):
+        if ctx.author.voice.channel.id != allowed_vc_id:
             return False
 
         return True
@@ -1255,60 +1631,33 @@ class UnifiedAudioRadio(commands.Cog):
             if cog != "audio":
                 return
 
+            # nothing is enforced before rrbind
+            if not self._cget("bound"):
+                return
+
             name = (ctx.command.name or "").lower()
-            allowed = await self._audio_cmd_is_allowed(ctx)
+            now = time.monotonic()
+            allowed_guild_id = self._cget("allowed_guild_id")
+            if allowed_guild_id and ctx.guild.id != allowed_guild_id:
+                # other guilds are never inside the perimeter; skip the owner lookup and go
+                # straight to the violation check below
+                allowed = False
+            else:
+                allowed = await self._audio_cmd_is_allowed(ctx)
 
-            if name in self.AUDIO_SUMMON_ALIASES and time.monotonic() <= self._allow_summon_until:
+            if name in self.AUDIO_SUMMON_ALIASES and now <= self._allow_summon_until:
                 return
 
             if allowed:
-                if name in self.AUDIO_PLAY_ALIASES:
-                    content = (ctx.message.content or "")
-                    if _looks_like_youtube(content):
-                        yt_query = self._extract_play_query(ctx) or content
-                        yt_query = str(yt_query)[:4000]
-
-                        blocked = await self._blocked_terms()
-                        if blocked and self._text_matches_blocklist(yt_query, blocked):
-                            await self._clear_audio_intent()
-                            await self._set_presence(None)
-                            await ctx.send("🚫 Blocked by safety filter (matched blocked terms in the request).")
-                            return
-
-                        if await self._radio_active():
-                            await self.config.last_station_name.set(await self.config.station_name())
-                            await self.config.last_station_stream_url.set(await self.config.stream_url())
-                            await self._clear_radio_state()
-                            await self._set_presence(None)
-
-                        await self.config.audio_intent_active.set(True)
-                        await self.config.audio_intent_started_monotonic.set(float(time.monotonic()))
-                        await self.config.last_youtube_query.set(yt_query)
-
-                        await self._dj_youtube_started(ctx.guild)
-
-                if name in self.AUDIO_STOP_ALIASES:
-                    await self._clear_radio_state()
-                    await self._clear_audio_intent()
-                    await self._set_presence(None)
-                    await self._dj_youtube_stopped(ctx.guild)
-
-                if name in self.AUDIO_DISCONNECT_ALIASES:
-                    await self._clear_radio_state()
-                    await self._clear_audio_intent()
-                    await self._set_presence(None)
-                    now = time.monotonic()
-                    self._home_grace_until = now + HOME_GRACE_SECONDS
-                    self._allow_summon_until = now + SUMMON_GRACE_SECONDS
-                    await self._dj_youtube_stopped(ctx.guild)
-
+                handler = self._audio_dispatch.get(name)
+                if handler is not None:
+                    await handler(ctx, now)
                 return
 
-            if not await self._any_active(ctx.guild):
+            if not self._any_active(ctx.guild):
                 return
 
-            hard = await self.config.hard_mode()
-            if hard:
+            if self._cget("hard_mode"):
                 await self._autopanic(ctx.guild, f"Audio `{name}` used outside perimeter while active")
             else:
                 await self._suspend(f"Audio `{name}` used outside perimeter while active")
@@ -1323,283 +1672,400 @@ class UnifiedAudioRadio(commands.Cog):
         except Exception:
             pass
 
+    async def _on_audio_play(self, ctx: commands.Context, now: float) -> None:
+        content = (ctx.message.content or "")
+        if not _looks_like_youtube(content):
+            return
+        yt_query = self._extract_play_query(ctx) or content
+        yt_query = str(yt_query)[:4000]
+
+        if self._text_matches_blocklist(yt_query):
+            await self._clear_audio_intent()
+            await self._set_presence(None)
+            await ctx.send("🚫 Blocked by safety filter (matched blocked terms in the request).")
+            return
+
+        # save radio for restore, clear it, record intent. Play commands come in bursts, so this
+        # is write-behind: the snapshot changes now and the next write (or a panic) persists it.
+        updates: Dict[str, Any] = {
+            "audio_intent_active": True,
+            "last_youtube_query": yt_query,
+        }
+        station_name = self._cget("station_name")
+        stream_url = self._cget("stream_url")
+        radio_was_active = bool(stream_url and station_name)
+        if radio_was_active:
+            updates.update(
+                last_station_name=station_name,
+                last_station_stream_url=stream_url,
+                stream_url=None,
+                station_name=None,
+            )
+        self._cfg_defer(**updates)
+        self._audio_intent_started = now
+
+        if radio_was_active:
+            await self._set_presence(None)
+
+        await self._dj_youtube_started(ctx.guild)
+
+    async def _on_audio_stop(self, ctx: commands.Context, now: float) -> None:
+        await self._reset_playback_state()
+        await self._dj_youtube_stopped(ctx.guild)
+
+    async def _on_audio_disconnect(self, ctx: commands.Context, now: float) -> None:
+        await self._reset_playback_state()
+        self._home_grace_until = now + HOME_GRACE_SECONDS
+        self._allow_summon_until = now + SUMMON_GRACE_SECONDS
+        await self._dj_youtube_stopped(ctx.guild)
+
     # -------------------------
     # Watchdog (includes POST-RESOLVE FALLBACK FILTER)
     # -------------------------
-    async def _watchdog_loop(self):
-        await self.bot.wait_until_ready()
-        while self.bot.is_ready():
-            try:
-                await asyncio.sleep(WATCHDOG_INTERVAL)
-
-                if not await self.config.bound():
-                    continue
-                if await self.config.panic_locked():
-                    continue
-                if await self.config.suspended():
-                    continue
-                if time.monotonic() <= self._home_grace_until:
-                    continue
-
-                guild_id = await self.config.allowed_guild_id()
-                if not guild_id:
-                    continue
-
-                guild = self.bot.get_guild(int(guild_id))
-                if not guild:
-                    continue
-
-                if not await self._any_active(guild):
-                    continue
-
-                if not await self._bot_is_home(guild):
-                    await self._autopanic(guild, "Watchdog: media active but bot is not home")
-                    continue
-
-                blocked = await self._blocked_terms()
-                if blocked:
-                    blob = self._current_track_text_from_audio(guild)
-                    if blob and self._text_matches_blocklist(blob, blocked):
-                        ll = self._get_lavalink()
-                        if ll:
-                            try:
-                                p = ll.get_player(guild.id)
-                                await p.stop()
-                            except Exception:
-                                pass
-                        else:
-                            try:
-                                await self._vc_disconnect(guild.voice_client)
-                            except Exception:
-                                pass
-
-                        await self._clear_radio_state()
-                        await self._clear_audio_intent()
-                        await self._set_presence(None)
-
-                        await self._audit_security(guild, "Watchdog: blocked term detected in resolved track metadata")
-                        await self._notify_control(
-                            guild,
-                            "🚫 Blocked Track Stopped",
-                            f"Blocked term detected in current track metadata:\n`{(blob[:200] + '…') if len(blob) > 200 else blob}`",
-                            discord.Color.orange(),
-                        )
-                        continue
+    @tasks.loop(seconds=WATCHDOG_INTERVAL)
+    async def _tick(self):
+        # one timer drives both: watchdog every tick, reassurance every REASSURE_EVERY ticks
+        try:
+            await self._watchdog_tick()
+        except Exception:
+            log.exception("Watchdog tick error")
 
-            except asyncio.CancelledError:
-                break
+        if self._tick.current_loop % REASSURE_EVERY == 0:
+            try:
+                await self._reassurance_tick()
             except Exception:
-                log.exception("Watchdog loop error")
+                log.exception("Periodic reassurance tick error")
 
-    # -------------------------
-    # Periodic loop (reassurance + sleep + break nudges + rest enforcement)
-    # -------------------------
-    async def _periodic_reassurance_loop(self):
+    @_tick.before_loop
+    async def _before_tick(self):
         await self.bot.wait_until_ready()
-        while self.bot.is_ready():
-            try:
-                await asyncio.sleep(REASSURE_TICK)
-
-                if not await self.config.bound():
-                    continue
-                if await self.config.panic_locked():
-                    continue
-                if await self.config.suspended():
-                    continue
-                if not await self.config.periodic_reassure_enabled():
-                    continue
-
-                guild_id = await self.config.allowed_guild_id()
-                allowed_vc_id = await self.config.allowed_voice_channel_id()
-                dj_user_id = await self.config.dj_user_id()
-                if not guild_id or not allowed_vc_id or not dj_user_id:
-                    continue
-
-                guild = self.bot.get_guild(int(guild_id))
-                if not guild:
-                    continue
-
-                if not await self._any_active(guild):
-                    self._set_grey_fatigue(0.0)
-                    self._dj_in_vc_since_monotonic = 0.0
+        # first check one interval after ready, as the old sleep-first loops did
+        await asyncio.sleep(WATCHDOG_INTERVAL)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(
+        self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState
+    ):
+        if before.channel == after.channel:
+            return
+        if not self._cget("bound") or member.guild.id != self._cget("allowed_guild_id"):
+            return
+        if self._cget("panic_locked") or self._cget("suspended"):
+            return
+
+        if self.bot.user and member.id == self.bot.user.id:
+            self._spawn(self._recheck_home_after_move(member.guild))
+        elif member.id == self._cget("dj_user_id"):
+            joined_home = bool(after.channel and after.channel.id == self._cget("allowed_voice_channel_id"))
+            # start/stop the parked-in-VC clock at the actual move instead of at the next tick
+            if joined_home:
+                if self._dj_in_vc_since_monotonic <= 0.0:
+                    self._dj_in_vc_since_monotonic = time.monotonic()
                     self._dj_sleep_stage = 0
-                    continue
-                if not await self._bot_is_home(guild):
-                    continue
+            else:
+                self._dj_in_vc_since_monotonic = 0.0
+                self._dj_sleep_stage = 0
+                self._set_grey_fatigue(0.0)
 
-                member = guild.get_member(int(dj_user_id))
-                if not member:
-                    continue
+    async def _recheck_home_after_move(self, guild: discord.Guild) -> None:
+        # our own stop/move commands clear state around the disconnect; give them a moment
+        await asyncio.sleep(VOICE_RECHECK_DELAY)
+        try:
+            if self._cget("panic_locked") or self._cget("suspended"):
+                return
+            if time.monotonic() <= self._home_grace_until:
+                return
+            if not self._cget("bound") or guild.id != self._cget("allowed_guild_id"):
+                return
+            if not self._any_active(guild):
+                return
+            if not self._bot_is_home(guild):
+                await self._autopanic(guild, "Watchdog: media active but bot is not home")
+        except Exception:
+            log.exception("Voice state recheck error")
 
-                dj_in_allowed_vc = bool(
-                    member.voice and member.voice.channel and member.voice.channel.id == int(allowed_vc_id)
-                )
+    async def _watchdog_tick(self) -> None:
+        now = time.monotonic()
+        if now - self._cfg_loaded_at >= CFG_REFRESH_SECONDS:
+            await self._refresh_cfg()
 
-                # enforce rest first
-                await self._enforce_rest_if_needed(guild, dj_in_allowed_vc)
-                if await self.config.panic_locked() or await self.config.suspended():
-                    continue
-
-                radio = await self._radio_active()
-                station_name = await self.config.station_name() if radio else None
-                last_station = await self.config.last_station_name()
-                audio_intent = await self.config.audio_intent_active()
-
-                if radio and station_name:
-                    line = f"**station:** {station_name}"
-                elif audio_intent:
-                    line = "**media:** youtube playback active"
-                elif last_station:
-                    line = f"**media:** playback active\n**radio saved:** {last_station}"
-                else:
-                    line = "**media:** playback active"
+        if not self._cget("bound"):
+            return
+        if self._cget("panic_locked"):
+            return
+        if self._cget("suspended"):
+            return
+        if now <= self._home_grace_until:
+            return
 
-                now = time.monotonic()
+        guild_id = self._cget("allowed_guild_id")
+        if not guild_id:
+            return
 
-                # track DJ time parked in VC
-                if dj_in_allowed_vc:
-                    if self._dj_in_vc_since_monotonic <= 0.0:
-                        self._dj_in_vc_since_monotonic = now
-                        self._dj_sleep_stage = 0
-                else:
-                    self._dj_in_vc_since_monotonic = 0.0
-                    self._dj_sleep_stage = 0
-                    self._set_grey_fatigue(0.0)
-
-                # Grey fatigue ramp
-                if await self.config.dj_grey_fatigue_enabled() and dj_in_allowed_vc and self._dj_in_vc_since_monotonic > 0.0:
-                    mins_in_vc = int((now - self._dj_in_vc_since_monotonic) // 60)
-                    start_after = int(await self.config.dj_grey_fatigue_after_minutes() or 0)
-                    max_after = int(await self.config.dj_grey_fatigue_max_minutes() or 1)
-                    if max_after <= start_after:
-                        max_after = start_after + 1
-
-                    if mins_in_vc <= start_after:
-                        f = 0.0
-                    else:
-                        f = (mins_in_vc - start_after) / float(max_after - start_after)
-                    self._set_grey_fatigue(f)
-
-                    # break nudge
-                    min_f = float(await self.config.dj_break_nudge_min_fatigue() or 0.0)
-                    repeat_mins = int(await self.config.dj_break_nudge_repeat_minutes() or 0)
-                    repeat_mins = max(10, repeat_mins)
-
-                    if self._grey_fatigue_level >= min_f:
-                        if (
-                            self._last_break_nudge_monotonic <= 0.0
-                            or (now - self._last_break_nudge_monotonic) >= (repeat_mins * 60)
-                        ):
-                            self._last_break_nudge_monotonic = now
-                            if self._grey_fatigue_level < 0.75:
-                                title = "…break?"
-                                desc = "im getting kinda sleepy too.\ntake 5.\nwater. stretch.\nthen come back."
-                            else:
-                                title = "…hey. pause."
-                                desc = "im rly sleepy.\npls take a break.\nu dont have to push.\nim still here."
-                            await self._send_to_dj(
-                                guild,
-                                self._grey_embed(
-                                    title=title,
-                                    description=desc,
-                                    footer="(break nudge) u can rest. i guard.",
-                                ),
-                            )
-                else:
-                    self._set_grey_fatigue(0.0)
-
-                # sleep reminders
-                if await self.config.dj_sleep_enabled():
-                    if dj_in_allowed_vc and self._dj_in_vc_since_monotonic > 0.0:
-                        mins_in_vc = int((now - self._dj_in_vc_since_monotonic) // 60)
-                        t1 = int(await self.config.dj_sleep_first_minutes() or 0)
-                        t2 = int(await self.config.dj_sleep_second_minutes() or 0)
-                        t3 = int(await self.config.dj_sleep_third_minutes() or 0)
-
-                        if self._dj_sleep_stage < 1 and t1 > 0 and mins_in_vc >= t1:
-                            self._dj_sleep_stage = 1
-                            await self._dj_sleep_reminder(guild, mins_in_vc, 1)
-                        elif self._dj_sleep_stage < 2 and t2 > 0 and mins_in_vc >= t2:
-                            self._dj_sleep_stage = 2
-                            await self._dj_sleep_reminder(guild, mins_in_vc, 2)
-                        elif self._dj_sleep_stage < 3 and t3 > 0 and mins_in_vc >= t3:
-                            self._dj_sleep_stage = 3
-                            await self._dj_sleep_reminder(guild, mins_in_vc, 3)
-
-                # normal reassurance cadence
-                if dj_in_allowed_vc:
-                    interval = max(int(await self.config.reassure_interval_in_vc_sec() or 0), 30)
-                    if now - self._last_reassure_in_vc_ts < interval:
-                        continue
-                    self._last_reassure_in_vc_ts = now
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return
 
-                    await self._send_to_dj(
-                        guild,
-                        self._grey_embed(
-                            title="🖤 it's ok.",
-                            description=f"ur safe.\nim here.\n{line}",
-                            footer="Grey Hair Asuka protocol: reassurance (in vc).",
-                        ),
-                    )
+        if not self._any_active(guild):
+            return
+
+        if not self._bot_is_home(guild):
+            await self._autopanic(guild, "Watchdog: media active but bot is not home")
+            return
+
+        if self._blocklist():
+            blob = self._current_track_text_from_audio(guild)
+            if blob and self._text_matches_blocklist(blob):
+                ll = self._get_lavalink()
+                if ll:
+                    try:
+                        p = ll.get_player(guild.id)
+                        await p.stop()
+                    except Exception:
+                        pass
                 else:
-                    interval = max(int(await self.config.reassure_interval_out_vc_sec() or 0), 60)
-                    if now - self._last_reassure_out_vc_ts < interval:
-                        continue
-                    self._last_reassure_out_vc_ts = now
+                    try:
+                        await self._vc_disconnect(guild.voice_client)
+                    except Exception:
+                        pass
+
+                await self._reset_playback_state()
+
+                await self._audit_security(guild, "Watchdog: blocked term detected in resolved track metadata")
+                await self._notify_control(
+                    guild,
+                    "🚫 Blocked Track Stopped",
+                    f"Blocked term detected in current track metadata:\n`{(blob[:200] + '…') if len(blob) > 200 else blob}`",
+                    discord.Color.orange(),
+                )
+                return
+
+    # -------------------------
+    # Periodic loop (reassurance + sleep + break nudges + rest enforcement)
+    # -------------------------
+    async def _reassurance_tick(self) -> None:
+        if not self._cget("bound"):
+            return
+        if self._cget("panic_locked"):
+            return
+        if self._cget("suspended"):
+            return
+        if not self._cget("periodic_reassure_enabled"):
+            return
+
+        guild_id = self._cget("allowed_guild_id")
+        allowed_vc_id = self._cget("allowed_voice_channel_id")
+        dj_user_id = self._cget("dj_user_id")
+        if not guild_id or not allowed_vc_id or not dj_user_id:
+            return
+
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return
+
+        if not self._any_active(guild):
+            self._set_grey_fatigue(0.0)
+            self._dj_in_vc_since_monotonic = 0.0
+            self._dj_sleep_stage = 0
+            return
+        if not self._bot_is_home(guild):
+            return
+
+        member = guild.get_member(dj_user_id)
+        if not member:
+            return
+
+        dj_in_allowed_vc = bool(
+            member.voice and member.voice.channel and member.voice.channel.id == allowed_vc_id
+        )
+
+        # enforce rest first
+        await self._enforce_rest_if_needed(guild, dj_in_allowed_vc)
+        if self._cget("panic_locked") or self._cget("suspended"):
+            return
+
+        radio = self._radio_active()
+        station_name = self._cget("station_name") if radio else None
+        last_station = self._cget("last_station_name")
+        audio_intent = self._cget("audio_intent_active")
 
+        if radio and station_name:
+            line = f"**station:** {station_name}"
+        elif audio_intent:
+            line = "**media:** youtube playback active"
+        elif last_station:
+            line = f"**media:** playback active\n**radio saved:** {last_station}"
+        else:
+            line = "**media:** playback active"
+
+        now = time.monotonic()
+
+        # track DJ time parked in VC
+        if dj_in_allowed_vc:
+            if self._dj_in_vc_since_monotonic <= 0.0:
+                self._dj_in_vc_since_monotonic = now
+                self._dj_sleep_stage = 0
+        else:
+            self._dj_in_vc_since_monotonic = 0.0
+            self._dj_sleep_stage = 0
+            self._set_grey_fatigue(0.0)
+
+        # Grey fatigue ramp
+        if self._cget("dj_grey_fatigue_enabled") and dj_in_allowed_vc and self._dj_in_vc_since_monotonic > 0.0:
+            mins_in_vc = int((now - self._dj_in_vc_since_monotonic) // 60)
+            start_after = int(self._cget("dj_grey_fatigue_after_minutes") or 0)
+            max_after = int(self._cget("dj_grey_fatigue_max_minutes") or 1)
+            if max_after <= start_after:
+                max_after = start_after + 1
+
+            if mins_in_vc <= start_after:
+                f = 0.0
+            else:
+                f = (mins_in_vc - start_after) / float(max_after - start_after)
+            self._set_grey_fatigue(f)
+
+            # break nudge
+            min_f = float(self._cget("dj_break_nudge_min_fatigue") or 0.0)
+            repeat_mins = int(self._cget("dj_break_nudge_repeat_minutes") or 0)
+            repeat_mins = max(10, repeat_mins)
+
+            if self._grey_fatigue_level >= min_f:
+                if (
+                    self._last_break_nudge_monotonic <= 0.0
+                    or (now - self._last_break_nudge_monotonic) >= (repeat_mins * 60)
+                ):
+                    self._last_break_nudge_monotonic = now
+                    if self._grey_fatigue_level < 0.75:
+                        title = "…break?"
+                        desc = "im getting kinda sleepy too.\ntake 5.\nwater. stretch.\nthen come back."
+                    else:
+                        title = "…hey. pause."
+                        desc = "im rly sleepy.\npls take a break.\nu dont have to push.\nim still here."
                     await self._send_to_dj(
                         guild,
                         self._grey_embed(
-                            title="🖤 it's ok.",
-                            description=f"im still here.\neven if ur not in the room.\n{line}",
-                            footer="Grey Hair Asuka protocol: reassurance (out of vc).",
+                            title=title,
+                            description=desc,
+                            footer="(break nudge) u can rest. i guard.",
                         ),
                     )
+        else:
+            self._set_grey_fatigue(0.0)
+
+        # sleep reminders
+        if self._cget("dj_sleep_enabled"):
+            if dj_in_allowed_vc and self._dj_in_vc_since_monotonic > 0.0:
+                mins_in_vc = int((now - self._dj_in_vc_since_monotonic) // 60)
+                t1 = int(self._cget("dj_sleep_first_minutes") or 0)
+                t2 = int(self._cget("dj_sleep_second_minutes") or 0)
+                t3 = int(self._cget("dj_sleep_third_minutes") or 0)
+
+                if self._dj_sleep_stage < 1 and t1 > 0 and mins_in_vc >= t1:
+                    self._dj_sleep_stage = 1
+                    await self._dj_sleep_reminder(guild, mins_in_vc, 1)
+                elif self._dj_sleep_stage < 2 and t2 > 0 and mins_in_vc >= t2:
+                    self._dj_sleep_stage = 2
+                    await self._dj_sleep_reminder(guild, mins_in_vc, 2)
+                elif self._dj_sleep_stage < 3 and t3 > 0 and mins_in_vc >= t3:
+                    self._dj_sleep_stage = 3
+                    await self._dj_sleep_reminder(guild, mins_in_vc, 3)
+
+        # normal reassurance cadence
+        if dj_in_allowed_vc:
+            interval = max(int(self._cget("reassure_interval_in_vc_sec") or 0), 30)
+            if now - self._last_reassure_in_vc_ts < interval:
+                return
+            self._last_reassure_in_vc_ts = now
 
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                log.exception("Periodic reassurance loop error")
+            await self._send_to_dj(
+                guild,
+                self._grey_embed_from(self._reassure_in_vc_tpl, f"ur safe.\nim here.\n{line}"),
+            )
+        else:
+            interval = max(int(self._cget("reassure_interval_out_vc_sec") or 0), 60)
+            if now - self._last_reassure_out_vc_ts < interval:
+                return
+            self._last_reassure_out_vc_ts = now
+
+            await self._send_to_dj(
+                guild,
+                self._grey_embed_from(
+                    self._reassure_out_vc_tpl, f"im still here.\neven if ur not in the room.\n{line}"
+                ),
+            )
 
     # -------------------------
     # Radio-browser
     # -------------------------
     async def _rb_get_json(self, path: str) -> Optional[Any]:
-        session = await self._ensure_http()
-        url = f"{RB_API}/{path.lstrip('/')}"
+        key = path.lstrip("/")
+        hit = self._rb_cache.get(key)
+        if hit:
+            age = time.monotonic() - hit[0]
+            if age < RB_CACHE_TTL:
+                self._rb_cache.move_to_end(key)
+                return hit[1]
+            if age < RB_CACHE_STALE:
+                if key not in self._rb_keylocks:
+                    self._spawn(self._rb_fetch(key))
+                return hit[1]
+        return await self._rb_fetch(key)
+
+    async def _rb_fetch(self, key: str) -> Optional[Any]:
+        lock = self._rb_keylocks.get(key)
+        if lock is None:
+            lock = self._rb_keylocks[key] = asyncio.Lock()
+        self._rb_keyusers[key] = self._rb_keyusers.get(key, 0) + 1
         try:
-            async with self._http_lock:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        return None
-                    return await resp.json(content_type=None)
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            return None
+            async with lock:
+                # another caller may have filled it while we waited
+                hit = self._rb_cache.get(key)
+                if hit and time.monotonic() - hit[0] < RB_CACHE_TTL:
+                    return hit[1]
 
-    def _blocked_by_tags(self, station: Station, blocked_tags: List[str]) -> bool:
-        blob = f"{station.tags} {station.name}".lower()
-        return any(t and t in blob for t in blocked_tags)
+                session = await self._ensure_http()
+                try:
+                    async with session.get(f"{RB_API}/{key}") as resp:
+                        if resp.status != 200:
+                            return None
+                        data = await resp.json(content_type=None)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    return None
+
+                self._rb_cache[key] = (time.monotonic(), data)
+                self._rb_cache.move_to_end(key)
+                if len(self._rb_cache) > RB_CACHE_MAX:
+                    self._rb_cache.popitem(last=False)
+                return data
+        finally:
+            # locked() is briefly False while a woken waiter is still queued, so count users instead
+            users = self._rb_keyusers[key] - 1
+            if users:
+                self._rb_keyusers[key] = users
+            else:
+                del self._rb_keyusers[key]
+                del self._rb_keylocks[key]
+
+    @staticmethod
+    def _norm_query(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def _blocked_by_tags(self, station: Station) -> bool:
+        return self._blob_matches_blocklist(station.blob)
 
     def _page_embed(
         self, ctx: commands.Context, query: str, page: int, total_pages: int, page_items: List[Station]
     ) -> discord.Embed:
         prefix = ctx.clean_prefix
+        start_index = page * PAGE_SIZE
+        rows = [f"**{idx}. {s.label}**\n{s.detail}" for idx, s in enumerate(page_items, start=start_index + 1)]
         embed = discord.Embed(
             title=f"🔎 Results for '{query}' (Page {page + 1}/{total_pages})",
+            description="\n\n".join(rows)[:4096],
             color=discord.Color.green(),
         )
-        start_index = page * PAGE_SIZE
-        for idx, s in enumerate(page_items, start=start_index + 1):
-            tags = s.tags if s.tags else "No tags"
-            if len(tags) > 100:
-                tags = tags[:97] + "..."
-            embed.add_field(
-                name=f"{idx}. {s.name} ({s.country})"[:256],
-                value=f"Bitrate: {s.bitrate} kbps\nTags: {tags}"[:1024],
-                inline=False,
-            )
         embed.set_footer(text=f"Owner-only. Use {prefix}playstation <number>.")
         return embed
 
@@ -1626,49 +2092,63 @@ class UnifiedAudioRadio(commands.Cog):
         if ctx.guild is None:
             return
 
-        bound = await self.config.bound()
-        allowed_guild_id = await self.config.allowed_guild_id()
-        control_id = await self.config.control_text_channel_id()
-        allowed_vc_id = await self.config.allowed_voice_channel_id()
-        audit_id = await self.config.audit_channel_id()
-        bound_owner_id = await self.config.bound_owner_user_id()
-
-        panic = await self.config.panic_locked()
-        autopanic_enabled = await self.config.autopanic_enabled()
-        autopanic_reason = await self.config.autopanic_reason()
-
-        suspended = await self.config.suspended()
-        suspend_reason = await self.config.suspend_reason()
-        hard = await self.config.hard_mode()
-
-        radio_active = await self._radio_active()
-        station_name = await self.config.station_name()
-        stream_url = await self.config.stream_url()
-        last_station = await self.config.last_station_name()
-        last_station_url = await self.config.last_station_stream_url()
-
-        audio_intent = await self.config.audio_intent_active()
-        audio_intent_started = float(await self.config.audio_intent_started_monotonic() or 0.0)
-        last_yt = await self.config.last_youtube_query()
-
-        pr_kind = await self.config.panic_resume_kind()
-        pr_station = await self.config.panic_resume_station_name()
-        pr_station_url = await self.config.panic_resume_station_url()
-        pr_yt = await self.config.panic_resume_youtube_query()
+        now = time.monotonic()
+        hit = self._status_cache.get(ctx.guild.id)
+        # any Config write in between (panic, unlock, station change) invalidates the cached page
+        if hit and now - hit[0] < STATUS_CACHE_TTL and hit[1] == self._cfg_gen:
+            await ctx.send(embed=hit[2])
+            return
+
+        # one snapshot read for the whole status page
+        g = self._cfg
+        bound = g["bound"]
+        allowed_guild_id = g["allowed_guild_id"]
+        control_id = g["control_text_channel_id"]
+        allowed_vc_id = g["allowed_voice_channel_id"]
+        audit_id = g["audit_channel_id"]
+        bound_owner_id = g["bound_owner_user_id"]
+
+        panic = g["panic_locked"]
+        autopanic_enabled = g["autopanic_enabled"]
+        autopanic_reason = g["autopanic_reason"]
+
+        suspended = g["suspended"]
+        suspend_reason = g["suspend_reason"]
+        hard = g["hard_mode"]
+
+        station_name = g["station_name"]
+        stream_url = g["stream_url"]
+        radio_active = bool(stream_url and station_name)
+        last_station = g["last_station_name"]
+        last_station_url = g["last_station_stream_url"]
+
+        audio_intent = g["audio_intent_active"]
+        audio_intent_started = self._audio_intent_started
+        last_yt = g["last_youtube_query"]
+
+        pr_kind = g["panic_resume_kind"]
+        pr_station = g["panic_resume_station_name"]
+        pr_station_url = g["panic_resume_station_url"]
+        pr_yt = g["panic_resume_youtube_query"]
 
         vc = ctx.guild.voice_client
         vc_connected = self._vc_connected(vc)
         vc_channel_id = self._vc_channel_id(vc)
-        bot_home = await self._bot_is_home(ctx.guild)
+        bot_home = self._bot_is_home(ctx.guild)
         player_playing = self._player_is_playing(ctx.guild)
 
-        now = time.monotonic()
         intent_age = self._fmt_secs(now - audio_intent_started) if (audio_intent and audio_intent_started) else "—"
 
-        control_ch = ctx.guild.get_channel(int(control_id)) if control_id else None
-        audit_ch = ctx.guild.get_channel(int(audit_id)) if audit_id else None
-        allowed_vc = ctx.guild.get_channel(int(allowed_vc_id)) if allowed_vc_id else None
-        bot_vc = ctx.guild.get_channel(int(vc_channel_id)) if vc_channel_id else None
+        control_ch = self._memo_text_channel(ctx.guild, "control_text_channel_id")
+        audit_ch = self._memo_text_channel(ctx.guild, "audit_channel_id")
+        allowed_vc = ctx.guild.get_channel(allowed_vc_id) if allowed_vc_id else None
+        bot_vc = ctx.guild.get_channel(vc_channel_id) if vc_channel_id else None
+
+        fmt_id = self._fmt_id
+        control_s = control_ch.mention if control_ch else fmt_id(control_id)
+        audit_s = audit_ch.mention if audit_ch else fmt_id(audit_id)
+        allowed_vc_s = allowed_vc.mention if allowed_vc else fmt_id(allowed_vc_id)
+        bot_vc_s = bot_vc.mention if bot_vc else fmt_id(vc_channel_id)
 
         embed = discord.Embed(
             title="🛡️ Unified Audio/Radio Status",
@@ -1677,13 +2157,15 @@ class UnifiedAudioRadio(commands.Cog):
 
         embed.add_field(
             name="Binding / Perimeter",
-            value=(
-                f"**Bound:** {self._fmt_yesno(bool(bound))}\n"
-                f"**Allowed Guild:** {self._fmt_id(int(allowed_guild_id) if allowed_guild_id else None)}\n"
-                f"**Control Channel:** {control_ch.mention if isinstance(control_ch, discord.TextChannel) else self._fmt_id(int(control_id) if control_id else None)}\n"
-                f"**Locked VC:** {allowed_vc.mention if allowed_vc else self._fmt_id(int(allowed_vc_id) if allowed_vc_id else None)}\n"
-                f"**Audit Channel:** {audit_ch.mention if isinstance(audit_ch, discord.TextChannel) else self._fmt_id(int(audit_id) if audit_id else None)}\n"
-                f"**Bound Owner ID:** {self._fmt_id(int(bound_owner_id) if bound_owner_id else None)}"
+            value="\n".join(
+                (
+                    f"**Bound:** {self._fmt_yesno(bound)}",
+                    f"**Allowed Guild:** {fmt_id(allowed_guild_id)}",
+                    f"**Control Channel:** {control_s}",
+                    f"**Locked VC:** {allowed_vc_s}",
+                    f"**Audit Channel:** {audit_s}",
+                    f"**Bound Owner ID:** {fmt_id(bound_owner_id)}",
+                )
             ),
             inline=False,
         )
@@ -1691,12 +2173,12 @@ class UnifiedAudioRadio(commands.Cog):
         embed.add_field(
             name="Safety State",
             value=(
-                f"**Panic Locked:** {self._fmt_yesno(bool(panic))}\n"
-                f"**AutoPanic Enabled:** {self._fmt_yesno(bool(autopanic_enabled))}\n"
+                f"**Panic Locked:** {self._fmt_yesno(panic)}\n"
+                f"**AutoPanic Enabled:** {self._fmt_yesno(autopanic_enabled)}\n"
                 f"**AutoPanic Reason:** {autopanic_reason or '—'}\n"
-                f"**Suspended:** {self._fmt_yesno(bool(suspended))}\n"
+                f"**Suspended:** {self._fmt_yesno(suspended)}\n"
                 f"**Suspend Reason:** {suspend_reason or '—'}\n"
-                f"**Hard Mode:** {self._fmt_yesno(bool(hard))}"
+                f"**Hard Mode:** {self._fmt_yesno(hard)}"
             ),
             inline=False,
         )
@@ -1704,11 +2186,11 @@ class UnifiedAudioRadio(commands.Cog):
         embed.add_field(
             name="Bot Voice / Playback",
             value=(
-                f"**VC Connected:** {self._fmt_yesno(bool(vc_connected))}\n"
-                f"**Bot VC:** {bot_vc.mention if bot_vc else (self._fmt_id(int(vc_channel_id)) if vc_channel_id else '—')}\n"
-                f"**Bot Is Home:** {self._fmt_yesno(bool(bot_home))}\n"
-                f"**Player Is Playing (Audio):** {self._fmt_yesno(bool(player_playing))}\n"
-                f"**Audio Intent Active:** {self._fmt_yesno(bool(audio_intent))}\n"
+                f"**VC Connected:** {self._fmt_yesno(vc_connected)}\n"
+                f"**Bot VC:** {bot_vc_s}\n"
+                f"**Bot Is Home:** {self._fmt_yesno(bot_home)}\n"
+                f"**Player Is Playing (Audio):** {self._fmt_yesno(player_playing)}\n"
+                f"**Audio Intent Active:** {self._fmt_yesno(audio_intent)}\n"
                 f"**Audio Intent Age:** {intent_age}"
             ),
             inline=False,
@@ -1717,7 +2199,7 @@ class UnifiedAudioRadio(commands.Cog):
         embed.add_field(
             name="Radio State",
             value=(
-                f"**Radio Active (saved):** {self._fmt_yesno(bool(radio_active))}\n"
+                f"**Radio Active (saved):** {self._fmt_yesno(radio_active)}\n"
                 f"**Station:** {station_name or '—'}\n"
                 f"**Stream URL:** {stream_url or '—'}\n"
                 f"**Last Station (restore):** {last_station or '—'}\n"
@@ -1746,6 +2228,7 @@ class UnifiedAudioRadio(commands.Cog):
         embed.set_footer(
             text="Commands: rrstatus | rrbind | rrcontrol | rrmove | rrpanic | rrunlock [home|resume|full|radio] | rrrestore | rrsuspend | rrresume | rrhard"
         )
+        self._status_cache[ctx.guild.id] = (now, self._cfg_gen, embed)
         await ctx.send(embed=embed)
 
     @commands.is_owner()
@@ -1753,32 +2236,22 @@ class UnifiedAudioRadio(commands.Cog):
     async def rrpanic(self, ctx: commands.Context, *, reason: str = "Manual panic engaged"):
         if ctx.guild is None:
             return
-        if not await self.config.bound():
+        if not self._cget("bound"):
             await ctx.send("Not bound yet. Use `rrbind` first.")
             return
 
-        await self._snapshot_for_panic(ctx.guild)
-
-        await self.config.panic_locked.set(True)
-        await self.config.autopanic_reason.set(reason)
-
-        try:
-            await self._vc_disconnect(ctx.guild.voice_client)
-        except Exception:
-            pass
-
-        await self._clear_radio_state()
-        await self._clear_audio_intent()
-        await self._set_presence(None)
+        await self._engage_panic(ctx.guild, reason)
 
-        await self._audit_security(ctx.guild, f"Manual panic: {reason}")
-        await self._notify_control(
-            ctx.guild,
-            "🛑 Panic Engaged (Manual)",
-            f"{reason}\n\nSafe recovery:\n"
-            f"1) `rrunlock` (home-only)\n"
-            f"2) optionally `rrunlock radio` OR `rrunlock resume`",
-            discord.Color.red(),
+        await asyncio.gather(
+            self._audit_security(ctx.guild, f"Manual panic: {reason}"),
+            self._notify_control(
+                ctx.guild,
+                "🛑 Panic Engaged (Manual)",
+                f"{reason}\n\nSafe recovery:\n"
+                f"1) `rrunlock` (home-only)\n"
+                f"2) optionally `rrunlock radio` OR `rrunlock resume`",
+                discord.Color.red(),
+            ),
         )
         await ctx.send("Panic engaged.")
 
@@ -1787,7 +2260,7 @@ class UnifiedAudioRadio(commands.Cog):
     async def rrsuspend(self, ctx: commands.Context, *, reason: str = "Manual suspend"):
         if ctx.guild is None:
             return
-        if not await self.config.bound():
+        if not self._cget("bound"):
             await ctx.send("Not bound yet. Use `rrbind` first.")
             return
         if not await self._require_owner_in_allowed_vc(ctx):
@@ -1795,13 +2268,12 @@ class UnifiedAudioRadio(commands.Cog):
 
         await self._suspend(reason)
 
+        # leave voice while the state write runs; only disconnect errors are swallowed
+        disconnect = asyncio.ensure_future(self._vc_disconnect(ctx.guild.voice_client))
         try:
-            await self._vc_disconnect(ctx.guild.voice_client)
-        except Exception:
-            pass
-        await self._clear_radio_state()
-        await self._clear_audio_intent()
-        await self._set_presence(None)
+            await self._reset_playback_state()
+        finally:
+            await asyncio.gather(disconnect, return_exceptions=True)
 
         await self._notify_control(
             ctx.guild,
@@ -1816,7 +2288,7 @@ class UnifiedAudioRadio(commands.Cog):
     async def rrresume(self, ctx: commands.Context):
         if ctx.guild is None:
             return
-        if not await self.config.bound():
+        if not self._cget("bound"):
             await ctx.send("Not bound yet. Use `rrbind` first.")
             return
         if not await self._require_owner_in_allowed_vc(ctx):
@@ -1829,16 +2301,16 @@ class UnifiedAudioRadio(commands.Cog):
     @commands.command()
     async def rrhard(self, ctx: commands.Context, mode: Optional[str] = None):
         if mode is None:
-            cur = bool(await self.config.hard_mode())
+            cur = self._cget("hard_mode")
             await ctx.send(f"Hard mode is currently: **{cur}**. Use `rrhard on` or `rrhard off`.")
             return
 
         m = (mode or "").strip().lower()
         if m in ("on", "true", "1", "hard"):
-            await self.config.hard_mode.set(True)
+            await self._cset("hard_mode", True)
             await ctx.send("Hard mode: **ON** (violations trigger panic).")
         elif m in ("off", "false", "0", "soft"):
-            await self.config.hard_mode.set(False)
+            await self._cset("hard_mode", False)
             await ctx.send("Hard mode: **OFF** (violations trigger suspend).")
         else:
             await ctx.send("Use `rrhard on` or `rrhard off`.")
@@ -1847,45 +2319,44 @@ class UnifiedAudioRadio(commands.Cog):
         if not ctx.guild:
             return False, "No guild."
 
-        await self._clear_radio_state()
-        await self._clear_audio_intent()
-        await self._set_presence(None)
+        await self._reset_playback_state()
 
-        kind = (await self.config.panic_resume_kind()) or ""
+        now = time.monotonic()
+        g = self._cfg
+
+        kind = g["panic_resume_kind"] or ""
         if kind == "youtube":
-            q = await self.config.panic_resume_youtube_query()
+            q = g["panic_resume_youtube_query"]
             if q:
-                await self.config.audio_intent_active.set(True)
-                await self.config.audio_intent_started_monotonic.set(float(time.monotonic()))
+                await self._cfg_update(audio_intent_active=True)
+                self._audio_intent_started = now
                 ok = await self._audio_play(ctx, q)
                 if ok:
                     await self._set_presence("▶️ YouTube")
                     return True, "Resumed from panic snapshot: YouTube."
         elif kind == "radio":
-            n = await self.config.panic_resume_station_name()
-            u = await self.config.panic_resume_station_url()
+            n = g["panic_resume_station_name"]
+            u = g["panic_resume_station_url"]
             if n and u:
-                await self.config.stream_url.set(u)
-                await self.config.station_name.set(n)
+                await self._cfg_update(stream_url=u, station_name=n)
                 ok = await self._audio_play(ctx, u)
                 if ok:
                     await self._set_presence(f"📻 {n}")
                     return True, "Resumed from panic snapshot: Radio."
 
-        q2 = await self.config.last_youtube_query()
+        q2 = g["last_youtube_query"]
         if q2:
-            await self.config.audio_intent_active.set(True)
-            await self.config.audio_intent_started_monotonic.set(float(time.monotonic()))
+            await self._cfg_update(audio_intent_active=True)
+            self._audio_intent_started = now
             ok = await self._audio_play(ctx, q2)
             if ok:
                 await self._set_presence("▶️ YouTube")
                 return True, "Resumed from memory: YouTube."
 
-        n2 = await self.config.last_station_name()
-        u2 = await self.config.last_station_stream_url()
+        n2 = g["last_station_name"]
+        u2 = g["last_station_stream_url"]
         if n2 and u2:
-            await self.config.stream_url.set(u2)
-            await self.config.station_name.set(n2)
+            await self._cfg_update(stream_url=u2, station_name=n2)
             ok = await self._audio_play(ctx, u2)
             if ok:
                 await self._set_presence(f"📻 {n2}")
@@ -1894,23 +2365,24 @@ class UnifiedAudioRadio(commands.Cog):
         return False, "No resume targets found."
 
     async def _restore_radio_after_unlock(self, ctx: commands.Context) -> Tuple[bool, str]:
-        last_name = await self.config.last_station_name()
-        last_url = await self.config.last_station_stream_url()
+        last_name, last_url = self._cget("last_station_name"), self._cget("last_station_stream_url")
         if not last_name or not last_url:
             return False, "No saved station to restore."
 
-        try:
-            await self._audio_stop(ctx)
-        except Exception:
-            pass
+        # Audio's play enqueues rather than preempting, so only stop when something is actually playing.
+        if self._any_active(ctx.guild):
+            try:
+                await self._audio_stop(ctx)
+            except Exception:
+                pass
 
-        await self._clear_audio_intent()
-        await self._clear_radio_state()
+        await self._cfg_update(
+            audio_intent_active=False,
+            stream_url=last_url,
+            station_name=last_name,
+        )
         await self._set_presence(None)
 
-        await self.config.stream_url.set(last_url)
-        await self.config.station_name.set(last_name)
-
         ok = await self._audio_play(ctx, last_url)
         if not ok:
             return False, "Audio play failed for radio restore."
@@ -1918,12 +2390,20 @@ class UnifiedAudioRadio(commands.Cog):
         await self._set_presence(f"📻 {last_name}")
         return True, f"Unlocked + homed + switched to radio: {last_name}"
 
+    async def _notify_panic_cleared(self, ctx: commands.Context, *, home: str, playback: str, result: str) -> None:
+        await self._notify_control(
+            ctx.guild,
+            "✅ Panic Cleared",
+            f"Panic lock cleared by {ctx.author.mention}.\nHome: **{home}**\nPlayback: **{playback}**\nResult: {result}",
+            discord.Color.green(),
+        )
+
     @commands.is_owner()
     @commands.command()
     async def rrunlock(self, ctx: commands.Context, mode: Optional[str] = None):
         if ctx.guild is None:
             return
-        if not await self.config.bound():
+        if not self._cget("bound"):
             await ctx.send("Not bound yet. Use `rrbind` first.")
             return
         if not await self._require_owner_in_allowed_vc(ctx):
@@ -1936,9 +2416,7 @@ class UnifiedAudioRadio(commands.Cog):
         do_resume = m in ("resume", "full")
         do_radio = m == "radio"
 
-        await self.config.panic_locked.set(False)
-        await self.config.autopanic_reason.set(None)
-        await self._unsuspend()
+        await self._cfg_update(panic_locked=False, autopanic_reason=None, suspended=False, suspend_reason=None)
 
         if do_home:
             now = time.monotonic()
@@ -1953,36 +2431,27 @@ class UnifiedAudioRadio(commands.Cog):
         if do_radio:
             ok, msg = await self._restore_radio_after_unlock(ctx)
             result_line = f"✅ {msg}" if ok else f"⚠️ Unlock complete, but radio restore failed. ({msg})"
-            await ctx.send(result_line)
             await self._clear_panic_snapshot()
-            await self._notify_control(
-                ctx.guild,
-                "✅ Panic Cleared",
-                f"Panic lock cleared by {ctx.author.mention}.\nHome: **YES**\nPlayback: **RADIO**\nResult: {result_line}",
-                discord.Color.green(),
+            await asyncio.gather(
+                ctx.send(result_line),
+                self._notify_panic_cleared(ctx, home="YES", playback="RADIO", result=result_line),
             )
             return
 
         if do_resume:
             ok, msg = await self._attempt_resume_after_unlock(ctx)
             result_line = f"✅ {msg}" if ok else f"⚠️ Unlock complete, but nothing resumed. ({msg})"
-            await ctx.send(result_line)
             await self._clear_panic_snapshot()
-            await self._notify_control(
-                ctx.guild,
-                "✅ Panic Cleared",
-                f"Panic lock cleared by {ctx.author.mention}.\nHome: **YES**\nPlayback: **RESUME**\nResult: {result_line}",
-                discord.Color.green(),
+            await asyncio.gather(
+                ctx.send(result_line),
+                self._notify_panic_cleared(ctx, home="YES", playback="RESUME", result=result_line),
             )
             return
 
-        await ctx.send("✅ Unlocked + homed. Playback is OFF by default. Use `rrunlock radio` or `rrunlock resume`.")
         await self._clear_panic_snapshot()
-        await self._notify_control(
-            ctx.guild,
-            "✅ Panic Cleared",
-            f"Panic lock cleared by {ctx.author.mention}.\nHome: **YES**\nPlayback: **OFF**\nResult: Unlocked + homed (no playback).",
-            discord.Color.green(),
+        await asyncio.gather(
+            ctx.send("✅ Unlocked + homed. Playback is OFF by default. Use `rrunlock radio` or `rrunlock resume`."),
+            self._notify_panic_cleared(ctx, home="YES", playback="OFF", result="Unlocked + homed (no playback)."),
         )
 
     # -------------------------
@@ -1997,19 +2466,21 @@ class UnifiedAudioRadio(commands.Cog):
             await ctx.send("Join the voice channel you want locked first, then run rrbind again.")
             return
 
-        await self.config.allowed_guild_id.set(ctx.guild.id)
-        await self.config.control_text_channel_id.set(ctx.channel.id)
-        await self.config.allowed_voice_channel_id.set(ctx.author.voice.channel.id)
-        await self.config.bound_owner_user_id.set(ctx.author.id)
-
-        await self.config.bound.set(True)
-        await self.config.panic_locked.set(False)
-        await self.config.autopanic_enabled.set(True)
-        await self.config.autopanic_reason.set(None)
-
-        await self._unsuspend()
-        await self._clear_radio_state()
-        await self._clear_audio_intent()
+        await self._cfg_update(
+            allowed_guild_id=ctx.guild.id,
+            control_text_channel_id=ctx.channel.id,
+            allowed_voice_channel_id=ctx.author.voice.channel.id,
+            bound_owner_user_id=ctx.author.id,
+            bound=True,
+            panic_locked=False,
+            autopanic_enabled=True,
+            autopanic_reason=None,
+            suspended=False,
+            suspend_reason=None,
+            stream_url=None,
+            station_name=None,
+            audio_intent_active=False,
+        )
         await self._set_presence(None)
 
         await ctx.send("Bound. Use rrsetdj to set DJ Asuka. Use rrhome to bring her home.")
@@ -2038,26 +2509,30 @@ class UnifiedAudioRadio(commands.Cog):
 
         # HARD SAFETY: stop/leave everywhere before migrating.
         await self._disconnect_all_voice_clients()
-        await self._clear_radio_state()
-        await self._clear_audio_intent()
         await self._set_presence(None)
 
-        # Clear safety locks so you can operate immediately in the new guild.
-        await self.config.panic_locked.set(False)
-        await self.config.autopanic_reason.set(None)
-        await self.config.autopanic_enabled.set(True)
-        await self._unsuspend()
-
-        # Re-key perimeter to this guild + channels.
-        await self.config.allowed_guild_id.set(ctx.guild.id)
-        await self.config.control_text_channel_id.set(ctx.channel.id)
-        await self.config.allowed_voice_channel_id.set(ctx.author.voice.channel.id)
-        await self.config.bound_owner_user_id.set(ctx.author.id)
-        await self.config.bound.set(True)
-
         # If they haven't set a fallback, use the new control room.
-        if not await self.config.reassure_fallback_channel_id():
-            await self.config.reassure_fallback_channel_id.set(ctx.channel.id)
+        fallback_id = self._cget("reassure_fallback_channel_id")
+
+        await self._cfg_update(
+            # clear playback state
+            stream_url=None,
+            station_name=None,
+            audio_intent_active=False,
+            # clear safety locks so you can operate immediately in the new guild
+            panic_locked=False,
+            autopanic_reason=None,
+            autopanic_enabled=True,
+            suspended=False,
+            suspend_reason=None,
+            # re-key perimeter to this guild + channels
+            allowed_guild_id=ctx.guild.id,
+            control_text_channel_id=ctx.channel.id,
+            allowed_voice_channel_id=ctx.author.voice.channel.id,
+            bound_owner_user_id=ctx.author.id,
+            bound=True,
+            reassure_fallback_channel_id=fallback_id or ctx.channel.id,
+        )
 
         # Grace windows so summon/home transitions don't trip safeguards immediately.
         now = time.monotonic()
@@ -2093,7 +2568,7 @@ class UnifiedAudioRadio(commands.Cog):
     @commands.is_owner()
     @commands.command()
     async def rrsetdj(self, ctx: commands.Context, member: discord.Member):
-        await self.config.dj_user_id.set(member.id)
+        await self._cset("dj_user_id", member.id)
         await ctx.send(f"DJ Asuka target set to: {member.mention}")
 
     @commands.is_owner()
@@ -2101,12 +2576,12 @@ class UnifiedAudioRadio(commands.Cog):
     async def rrcontrol(self, ctx: commands.Context, channel: Optional[discord.TextChannel] = None):
         if ctx.guild is None:
             return
-        if not await self.config.bound():
+        if not self._cget("bound"):
             await ctx.send(f"Not bound yet. Use `{ctx.clean_prefix}rrbind` first.")
             return
 
-        allowed_guild_id = await self.config.allowed_guild_id()
-        if allowed_guild_id and ctx.guild.id != int(allowed_guild_id):
+        allowed_guild_id = self._cget("allowed_guild_id")
+        if allowed_guild_id and ctx.guild.id != allowed_guild_id:
             await ctx.send("Wrong guild.")
             return
 
@@ -2114,10 +2589,10 @@ class UnifiedAudioRadio(commands.Cog):
             return
 
         target = channel or ctx.channel
-        await self.config.control_text_channel_id.set(target.id)
+        await self._cset("control_text_channel_id", target.id)
 
-        if not await self.config.reassure_fallback_channel_id():
-            await self.config.reassure_fallback_channel_id.set(target.id)
+        if not self._cget("reassure_fallback_channel_id"):
+            await self._cset("reassure_fallback_channel_id", target.id)
 
         embed = discord.Embed(
             title="🛡️ Control Channel Re-Keyed",
@@ -2130,13 +2605,13 @@ class UnifiedAudioRadio(commands.Cog):
     @commands.is_owner()
     @commands.command()
     async def rrhome(self, ctx: commands.Context):
-        if await self.config.panic_locked():
+        if self._cget("panic_locked"):
             await ctx.send("Panic lock is active.")
             return
         if not await self._require_owner_in_allowed_vc(ctx):
             return
 
-        if ctx.guild and await self._bot_is_home(ctx.guild):
+        if ctx.guild and self._bot_is_home(ctx.guild):
             await ctx.send("She’s already home.")
             return
 
@@ -2150,8 +2625,8 @@ class UnifiedAudioRadio(commands.Cog):
         if not ok:
             return
 
-        if await self._radio_active():
-            station = await self.config.station_name()
+        if self._radio_active():
+            station = self._cget("station_name")
             if station:
                 await self._set_presence(f"📻 {station}")
 
@@ -2160,125 +2635,101 @@ class UnifiedAudioRadio(commands.Cog):
     @commands.is_owner()
     @commands.command()
     async def searchstations(self, ctx: commands.Context, *, query: str):
-        if not await self._require_owner_in_allowed_vc(ctx):
-            return
-        if not await self._require_bot_home(ctx):
-            return
-        if await self.config.suspended():
-            await ctx.send("Suspended. Use `rrresume`.")
-            return
-
         q = query.strip()
         if not q:
             await ctx.send("Give me a query.")
             return
 
-        encoded = urllib.parse.quote(q)
+        if not await self._gates(ctx):
+            return
+
+        # Radio Browser name search is case-insensitive; normalizing lets repeat searches hit the cache
+        q_norm = self._norm_query(q)
+        encoded = quote(q_norm)
         data = await self._rb_get_json(f"stations/byname/{encoded}")
         if not isinstance(data, list) or not data:
             await ctx.send("No stations found.")
             return
 
-        min_bitrate = int(await self.config.min_bitrate_kbps() or 0)
-        blocked_tags = await self._blocked_terms()
+        g = self._cfg
+        min_bitrate = int(g["min_bitrate_kbps"] or 0)
 
+        # cheapest checks first; only build a Station for rows that pass the bitrate floor,
+        # and stop as soon as the pager is full
         stations: List[Station] = []
-        for raw in data[:SEARCH_LIMIT]:
+        append = stations.append
+        blocked_by_tags = self._blocked_by_tags
+        from_rb = Station.from_rb
+        max_needed = PAGE_SIZE * MAX_PAGES
+        # Radio Browser lists the same stream under several entries; keep the first of each
+        seen_urls: Set[str] = set()
+        for raw in islice(data, SEARCH_LIMIT):
             if not isinstance(raw, dict):
                 continue
-            s = Station.from_rb(raw)
-            if not s:
+            br = int(raw.get("bitrate") or 0)
+            if br and br < min_bitrate:
                 continue
-            if s.bitrate and s.bitrate < min_bitrate:
-                continue
-            if self._blocked_by_tags(s, blocked_tags):
-                continue
-            stations.append(s)
+            s = from_rb(raw)
+            if s and s.stream_url not in seen_urls and not blocked_by_tags(s):
+                seen_urls.add(s.stream_url)
+                append(s)
+                if len(stations) >= max_needed:
+                    break
 
         if not stations:
             await ctx.send("No usable stations after filters.")
             return
 
-        async with self._cache_lock:
-            self._stations_cache = stations
+        self._stations_lru[q_norm] = stations
+        self._stations_lru.move_to_end(q_norm)
+        if len(self._stations_lru) > STATIONS_LRU_MAX:
+            self._stations_lru.popitem(last=False)
 
-        await self.config.last_search_query.set(q)
+        await self._cset("last_search_query", q)
 
         pages = [stations[i : i + PAGE_SIZE] for i in range(0, len(stations), PAGE_SIZE)]
         total_pages = len(pages)
-        page = 0
-
-        msg = await ctx.send(embed=self._page_embed(ctx, q, page, total_pages, pages[page]))
 
-        controls = ["⏮️", "◀️", "▶️", "⏭️"]
-        try:
-            for c in controls:
-                await msg.add_reaction(c)
-        except discord.Forbidden:
-            return
-
-        def check(reaction: discord.Reaction, user: discord.abc.User) -> bool:
-            return user.id == ctx.author.id and reaction.message.id == msg.id and str(reaction.emoji) in controls
-
-        while True:
-            try:
-                reaction, user = await self.bot.wait_for("reaction_add", timeout=REACTION_TIMEOUT, check=check)
-                emoji = str(reaction.emoji)
-
-                if emoji == "⏮️":
-                    page = 0
-                elif emoji == "◀️" and page > 0:
-                    page -= 1
-                elif emoji == "▶️" and page < total_pages - 1:
-                    page += 1
-                elif emoji == "⏭️":
-                    page = total_pages - 1
-
-                await msg.edit(embed=self._page_embed(ctx, q, page, total_pages, pages[page]))
+        # built once; page flips only pick from the list
+        embeds = [self._page_embed(ctx, q, i, total_pages, p) for i, p in enumerate(pages)]
 
-                try:
-                    await msg.remove_reaction(reaction, user)
-                except discord.Forbidden:
-                    pass
-
-            except asyncio.TimeoutError:
-                break
-
-        try:
-            await msg.clear_reactions()
-        except discord.Forbidden:
-            pass
+        view = _PagerView(ctx.author.id, embeds)
+        view.message = await ctx.send(embed=embeds[0], view=view)
 
     @commands.is_owner()
     @commands.command()
-    async def playstation(self, ctx: commands.Context, index: int):
-        if not await self._require_owner_in_allowed_vc(ctx):
-            return
-        if not await self._require_bot_home(ctx):
+    async def playstation(self, ctx: commands.Context, index: int, *, query: Optional[str] = None):
+        """Play result <index> from the last search, or from an earlier search by its query."""
+        if index < 1:
+            await ctx.send("Invalid station number.")
             return
-        if await self.config.suspended():
-            await ctx.send("Suspended. Use `rrresume`.")
+        if not await self._gates(ctx):
             return
 
-        async with self._cache_lock:
-            stations = list(self._stations_cache)
+        if query:
+            key = self._norm_query(query)
+            stations = self._stations_lru.get(key)
+            if stations is not None:
+                self._stations_lru.move_to_end(key)
+        else:
+            stations = next(reversed(self._stations_lru.values()), None)
 
         if not stations:
             await ctx.send(f"No cached results. Run `{ctx.clean_prefix}searchstations <query>` first.")
             return
-        if index < 1 or index > len(stations):
+        if index > len(stations):
             await ctx.send(f"Invalid station number. Use 1-{len(stations)}.")
             return
 
         station = stations[index - 1]
 
-        await self.config.last_station_name.set(station.name)
-        await self.config.last_station_stream_url.set(station.stream_url)
-
-        await self._clear_audio_intent()
-
-        await self.config.stream_url.set(station.stream_url)
-        await self.config.station_name.set(station.name)
+        await self._cfg_update(
+            last_station_name=station.name,
+            last_station_stream_url=station.stream_url,
+            audio_intent_active=False,
+            stream_url=station.stream_url,
+            station_name=station.name,
+        )
 
         ok = await self._audio_play(ctx, station.stream_url)
         if not ok:
@@ -2297,35 +2748,31 @@ class UnifiedAudioRadio(commands.Cog):
     @commands.is_owner()
     @commands.command()
     async def rrrestore(self, ctx: commands.Context):
-        if not await self._require_owner_in_allowed_vc(ctx):
-            return
-        if not await self._require_bot_home(ctx):
-            return
-        if await self.config.suspended():
-            await ctx.send("Suspended. Use `rrresume` first.")
+        if not await self._gates(ctx, "Suspended. Use `rrresume` first."):
             return
-        if await self.config.panic_locked():
+        if self._cget("panic_locked"):
             await ctx.send("Panic lock is active. Use `rrunlock` (home-only) first.")
             return
 
-        last_name = await self.config.last_station_name()
-        last_url = await self.config.last_station_stream_url()
+        last_name, last_url = self._cget("last_station_name"), self._cget("last_station_stream_url")
         if not last_name or not last_url:
             await ctx.send("No saved station to restore yet. Use `playstation` first.")
             return
 
-        try:
-            await self._audio_stop(ctx)
-        except Exception:
-            pass
+        # Audio's play enqueues rather than preempting, so only stop when something is actually playing.
+        if self._any_active(ctx.guild):
+            try:
+                await self._audio_stop(ctx)
+            except Exception:
+                pass
 
-        await self._clear_audio_intent()
-        await self._clear_radio_state()
+        await self._cfg_update(
+            audio_intent_active=False,
+            stream_url=last_url,
+            station_name=last_name,
+        )
         await self._set_presence(None)
 
-        await self.config.stream_url.set(last_url)
-        await self.config.station_name.set(last_name)
-
         ok = await self._audio_play(ctx, last_url)
         if not ok:
             return
@@ -2364,22 +2811,24 @@ class UnifiedAudioRadio(commands.Cog):
         if not ctx.guild:
             return
 
-        allowed_guild_id = await self.config.allowed_guild_id()
-        if allowed_guild_id and ctx.guild.id != int(allowed_guild_id):
+        g = self._cfg
+
+        allowed_guild_id = g["allowed_guild_id"]
+        if allowed_guild_id and ctx.guild.id != allowed_guild_id:
             return
 
-        dj_user_id = await self.config.dj_user_id()
-        if not dj_user_id or ctx.author.id != int(dj_user_id):
+        dj_user_id = g["dj_user_id"]
+        if not dj_user_id or ctx.author.id != dj_user_id:
             return
 
         control = await self._control_channel(ctx.guild)
         if not control:
             return
 
-        owner_id = await self.config.bound_owner_user_id()
-        owner_mention = f"<@{int(owner_id)}>" if owner_id else "@owner"
+        owner_id = g["bound_owner_user_id"]
+        owner_mention = f"<@{owner_id}>" if owner_id else "@owner"
 
-        last_station = await self.config.last_station_name()
+        last_station = g["last_station_name"]
         last_line = f"Last station saved: **{last_station}**" if last_station else "No saved station on record."
 
         note = (note or "").strip()
@@ -2407,12 +2856,14 @@ class UnifiedAudioRadio(commands.Cog):
         if not ctx.guild:
             return
 
-        allowed_guild_id = await self.config.allowed_guild_id()
-        if allowed_guild_id and ctx.guild.id != int(allowed_guild_id):
+        g = self._cfg
+
+        allowed_guild_id = g["allowed_guild_id"]
+        if allowed_guild_id and ctx.guild.id != allowed_guild_id:
             return
 
-        dj_user_id = await self.config.dj_user_id()
-        if not dj_user_id or ctx.author.id != int(dj_user_id):
+        dj_user_id = g["dj_user_id"]
+        if not dj_user_id or ctx.author.id != dj_user_id:
             return
 
         q = (query or "").strip()
@@ -2427,7 +2878,7 @@ class UnifiedAudioRadio(commands.Cog):
             return
 
         q = q[:1500]
-        await self.config.last_dj_youtube_request.set(q)
+        await self._cset("last_dj_youtube_request", q)
 
         control = await self._control_channel(ctx.guild)
         if not control:
@@ -2440,8 +2891,8 @@ class UnifiedAudioRadio(commands.Cog):
             )
             return
 
-        owner_id = await self.config.bound_owner_user_id()
-        owner_mention = f"<@{int(owner_id)}>" if owner_id else "@owner"
+        owner_id = g["bound_owner_user_id"]
+        owner_mention = f"<@{owner_id}>" if owner_id else "@owner"
 
         suggestion = f"Suggested action: `g!play {q}`"
         if not _looks_like_youtube(q):
@@ -2477,15 +2928,17 @@ class UnifiedAudioRadio(commands.Cog):
         if not ctx.guild:
             return
 
-        allowed_guild_id = await self.config.allowed_guild_id()
-        if allowed_guild_id and ctx.guild.id != int(allowed_guild_id):
+        g = self._cfg
+
+        allowed_guild_id = g["allowed_guild_id"]
+        if allowed_guild_id and ctx.guild.id != allowed_guild_id:
             return
 
-        dj_user_id = await self.config.dj_user_id()
-        if not dj_user_id or ctx.author.id != int(dj_user_id):
+        dj_user_id = g["dj_user_id"]
+        if not dj_user_id or ctx.author.id != dj_user_id:
             return
 
-        default_mins = int(await self.config.dj_rest_default_minutes() or 0)
+        default_mins = int(g["dj_rest_default_minutes"] or 0)
         default_mins = max(10, default_mins)
 
         mins = default_mins if minutes is None else int(minutes)
@@ -2520,10 +2973,10 @@ class UnifiedAudioRadio(commands.Cog):
         )
 
         # Notify Grey Hair Asuka (owner) so she can react if anything happens
-        if await self.config.dj_rest_notify_owner():
+        if g["dj_rest_notify_owner"]:
             control = await self._control_channel(ctx.guild)
-            owner_id = await self.config.bound_owner_user_id()
-            owner_mention = f"<@{int(owner_id)}>" if owner_id else "@owner"
+            owner_id = g["bound_owner_user_id"]
+            owner_mention = f"<@{owner_id}>" if owner_id else "@owner"
 
             embed = discord.Embed(
                 title="🛌 Rest Lock Armed",
@@ -2531,7 +2984,7 @@ class UnifiedAudioRadio(commands.Cog):
                     f"{owner_mention}\n"
                     f"DJ activated rest lock via `g!imgoing`.\n"
                     f"Duration: **{mins} min**\n"
-                    f"Enforce mode: **{(await self.config.dj_rest_enforce_mode()) or 'leave'}**\n"
+                    f"Enforce mode: **{g['dj_rest_enforce_mode'] or 'leave'}**\n"
                     f"Note: {self._rest_note or '—'}"
                 ),
                 color=discord.Color.green(),